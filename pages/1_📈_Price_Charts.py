@@ -16,17 +16,35 @@ from utils.auth import get_current_user
 from utils.data import (
     fetch_kaspa_price_data, 
     get_technical_indicators,
-    get_market_stats
+    get_overlay_indicators,
+    get_market_stats,
+    format_market_stats,
+    resample_price_data,
+    downsample_lttb,
+    downsample_bars,
+    TIME_RANGE_DAYS,
+    HISTORY_DAYS,
+    OVERLAY_WINDOWS
 )
 from utils.ui import (
     render_page_header, 
     render_sidebar_navigation,
     show_create_account_prompt,
     apply_custom_css,
+    render_seo_meta,
     render_chart_controls,
     render_footer
 )
 
+# Static SEO meta tags for this page
+SEO_META_HTML = """
+<meta name="description" content="Advanced Kaspa price charts with technical analysis tools, indicators, and real-time data visualization.">
+<meta name="keywords" content="Kaspa price charts, KAS technical analysis, cryptocurrency charts, blockchain price data">
+<meta property="og:title" content="Kaspa Price Charts - Advanced Technical Analysis">
+<meta property="og:description" content="Professional Kaspa price analysis with advanced charting tools and technical indicators">
+<meta property="og:type" content="website">
+"""
+
 # Configure page
 st.set_page_config(
     page_title="Price Charts - Kaspa Analytics Pro",
@@ -36,13 +54,7 @@ st.set_page_config(
 )
 
 # SEO Meta Tags
-st.markdown("""
-<meta name="description" content="Advanced Kaspa price charts with technical analysis tools, indicators, and real-time data visualization.">
-<meta name="keywords" content="Kaspa price charts, KAS technical analysis, cryptocurrency charts, blockchain price data">
-<meta property="og:title" content="Kaspa Price Charts - Advanced Technical Analysis">
-<meta property="og:description" content="Professional Kaspa price analysis with advanced charting tools and technical indicators">
-<meta property="og:type" content="website">
-""", unsafe_allow_html=True)
+render_seo_meta(SEO_META_HTML)
 
 # Apply styling
 apply_custom_css()
@@ -88,13 +100,6 @@ def main():
 def render_advanced_charts(user):
     """Render full advanced charting interface for all users"""
     
-    # Fetch full historical data for everyone
-    df = fetch_kaspa_price_data(365 * 2)  # 2 years of data for all
-    
-    if df.empty:
-        st.error("Unable to load price data")
-        return
-    
     # Advanced chart controls in tabs
     chart_tabs = sac.tabs([
         sac.TabsItem(label='Chart', icon='graph-up'),
@@ -103,14 +108,23 @@ def render_advanced_charts(user):
         sac.TabsItem(label='Settings', icon='gear'),
     ], key='chart_tabs')
     
+    if chart_tabs == 'Settings':
+        render_settings_tab()
+        return
+    
+    # One cached full-history frame for every tab; the Chart tab slices its range from it
+    df = fetch_kaspa_price_data(HISTORY_DAYS)
+    
+    if df.empty:
+        st.error("Unable to load price data")
+        return
+    
     if chart_tabs == 'Chart':
         render_main_chart_tab(df, user)
     elif chart_tabs == 'Indicators':
-        render_indicators_tab(df)
-    elif chart_tabs == 'Analysis':
-        render_analysis_tab(df)
+        render_indicators_tab(df, get_technical_indicators(df))
     else:
-        render_settings_tab()
+        render_analysis_tab(df)
 
 def render_main_chart_tab(df, user):
     """Main charting interface"""
@@ -149,21 +163,13 @@ def render_main_chart_tab(df, user):
             key="chart_style"
         )
     
-    # Filter data based on time range
-    if time_range == "7D":
-        chart_data = df.tail(7 * 24)
-    elif time_range == "30D":
-        chart_data = df.tail(30 * 24)
-    elif time_range == "3M":
-        chart_data = df.tail(90 * 24)
-    elif time_range == "6M":
-        chart_data = df.tail(180 * 24)
-    elif time_range == "1Y":
-        chart_data = df.tail(365 * 24)
-    elif time_range == "2Y":
-        chart_data = df.tail(730 * 24)
-    else:
-        chart_data = df
+    # Filter data based on time range (hourly rows)
+    days = TIME_RANGE_DAYS.get(time_range)
+    chart_data = df if days is None else df.iloc[-days * 24:]
+    
+    # Keep the hourly window for 24h statistics, chart the selected timeframe
+    hourly_data = chart_data
+    chart_data = resample_price_data(chart_data, timeframe)
     
     # Advanced indicators selection
     col1, col2 = st.columns(2)
@@ -196,14 +202,13 @@ def render_main_chart_tab(df, user):
     with col3:
         auto_scale = st.checkbox("Auto Scale", value=True, key="auto_scale")
     
-    # Create professional chart
-    fig = create_professional_chart(
+    # Create professional chart (reused across reruns with the same selection)
+    fig = get_professional_chart(
         chart_data, 
         chart_type, 
-        overlay_indicators, 
-        oscillator_indicators,
+        tuple(overlay_indicators), 
+        tuple(oscillator_indicators),
         show_volume,
-        show_events,
         chart_style,
         f"{time_range} Kaspa Price Analysis"
     )
@@ -211,7 +216,25 @@ def render_main_chart_tab(df, user):
     st.plotly_chart(fig, use_container_width=True)
     
     # Market statistics
-    render_market_statistics(chart_data)
+    render_market_statistics(hourly_data)
+
+@st.cache_resource(ttl=300, max_entries=32, show_spinner=False)
+def get_professional_chart(df, chart_type, overlay_indicators, oscillator_indicators,
+                           show_volume, chart_style, title):
+    """
+    Build the main chart once per data window and control selection
+    The figure is shared read-only across reruns; st.plotly_chart serializes a copy
+    """
+    return create_professional_chart(
+        df,
+        chart_type,
+        list(overlay_indicators),
+        list(oscillator_indicators),
+        show_volume,
+        False,  # no event markers are drawn yet, so Show Events isn't part of the key
+        chart_style,
+        title
+    )
 
 def create_professional_chart(df, chart_type, overlay_indicators, oscillator_indicators, 
                             show_volume, show_events, chart_style, title):
@@ -241,186 +264,162 @@ def create_professional_chart(df, chart_type, overlay_indicators, oscillator_ind
         row_heights=[0.6] + [0.2] * (subplot_count - 1)
     )
     
+    # Extract columns once so every trace shares the same arrays
+    ts = df['timestamp'].to_numpy()
+    price = df['price'].to_numpy()
+    
+    # (trace, subplot row) pairs, added to the figure in a single batch
+    traces = []
+    
     # Main price chart
     if chart_type == "Line":
-        fig.add_trace(go.Scatter(
-            x=df['timestamp'],
-            y=df['price'],
+        x_ds, y_ds = downsample_lttb(ts, price)
+        traces.append((go.Scattergl(
+            x=x_ds,
+            y=y_ds,
             mode='lines',
             name='KAS Price',
             line=dict(color='#70C7BA', width=2)
-        ), row=1, col=1)
+        ), 1))
     elif chart_type == "Candlestick":
-        fig.add_trace(go.Candlestick(
-            x=df['timestamp'],
+        traces.append((go.Candlestick(
+            x=ts,
             open=df['open'],
             high=df['high'],
             low=df['low'],
             close=df['close'],
             name='KAS Price'
-        ), row=1, col=1)
+        ), 1))
     elif chart_type == "Area":
-        fig.add_trace(go.Scatter(
-            x=df['timestamp'],
-            y=df['price'],
+        x_ds, y_ds = downsample_lttb(ts, price)
+        traces.append((go.Scattergl(
+            x=x_ds,
+            y=y_ds,
             mode='lines',
             fill='tonexty',
             name='KAS Price',
             line=dict(color='#70C7BA')
-        ), row=1, col=1)
+        ), 1))
     elif chart_type == "OHLC":
-        fig.add_trace(go.Ohlc(
-            x=df['timestamp'],
+        traces.append((go.Ohlc(
+            x=ts,
             open=df['open'],
             high=df['high'],
             low=df['low'],
             close=df['close'],
             name='KAS Price'
-        ), row=1, col=1)
+        ), 1))
     
     # Add overlay indicators
     current_row = 1
     
+    # Skip overlays whose lookback window is longer than the visible data
+    visible_overlays = tuple(sorted(
+        indicator for indicator in overlay_indicators
+        if len(price) >= OVERLAY_WINDOWS.get(indicator, 0)
+    ))
+    overlays = get_overlay_indicators(price, visible_overlays)
+    
     for indicator in overlay_indicators:
-        if indicator == "SMA 20":
-            sma_20 = df['price'].rolling(window=20).mean()
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
-                y=sma_20,
+        if indicator == "SMA 20" and 'sma_20' in overlays:
+            x_ds, y_ds = downsample_lttb(ts, overlays['sma_20'])
+            traces.append((go.Scattergl(
+                x=x_ds,
+                y=y_ds,
                 mode='lines',
                 name='SMA 20',
                 line=dict(color='orange', dash='dash')
-            ), row=current_row, col=1)
+            ), current_row))
         
-        elif indicator == "SMA 50":
-            sma_50 = df['price'].rolling(window=50).mean()
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
-                y=sma_50,
+        elif indicator == "SMA 50" and 'sma_50' in overlays:
+            x_ds, y_ds = downsample_lttb(ts, overlays['sma_50'])
+            traces.append((go.Scattergl(
+                x=x_ds,
+                y=y_ds,
                 mode='lines',
                 name='SMA 50',
                 line=dict(color='red', dash='dash')
-            ), row=current_row, col=1)
+            ), current_row))
         
-        elif indicator == "EMA 12":
-            ema_12 = df['price'].ewm(span=12).mean()
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
-                y=ema_12,
+        elif indicator == "EMA 12" and 'ema_12' in overlays:
+            x_ds, y_ds = downsample_lttb(ts, overlays['ema_12'])
+            traces.append((go.Scattergl(
+                x=x_ds,
+                y=y_ds,
                 mode='lines',
                 name='EMA 12',
                 line=dict(color='blue', dash='dot')
-            ), row=current_row, col=1)
+            ), current_row))
         
-        elif indicator == "EMA 26":
-            ema_26 = df['price'].ewm(span=26).mean()
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
-                y=ema_26,
+        elif indicator == "EMA 26" and 'ema_26' in overlays:
+            x_ds, y_ds = downsample_lttb(ts, overlays['ema_26'])
+            traces.append((go.Scattergl(
+                x=x_ds,
+                y=y_ds,
                 mode='lines',
                 name='EMA 26',
                 line=dict(color='purple', dash='dot')
-            ), row=current_row, col=1)
+            ), current_row))
         
-        elif indicator == "Bollinger Bands":
-            bb_middle = df['price'].rolling(window=20).mean()
-            bb_std = df['price'].rolling(window=20).std()
-            bb_upper = bb_middle + (bb_std * 2)
-            bb_lower = bb_middle - (bb_std * 2)
-            
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
-                y=bb_upper,
-                mode='lines',
-                name='BB Upper',
-                line=dict(color='gray', dash='dash'),
-                showlegend=False
-            ), row=current_row, col=1)
-            
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
-                y=bb_lower,
+        elif indicator == "Bollinger Bands" and 'bb_middle' in overlays:
+            # Upper band forward then lower band reversed: one closed, filled polygon
+            x_upper, y_upper = downsample_lttb(ts, overlays['bb_upper'])
+            x_lower, y_lower = downsample_lttb(ts, overlays['bb_lower'])
+            traces.append((go.Scattergl(
+                x=np.concatenate([x_upper, x_lower[::-1]]),
+                y=np.concatenate([y_upper, y_lower[::-1]]),
                 mode='lines',
-                name='BB Lower',
+                name='BB Bands',
                 line=dict(color='gray', dash='dash'),
-                fill='tonexty',
+                fill='toself',
                 fillcolor='rgba(128,128,128,0.1)',
                 showlegend=False
-            ), row=current_row, col=1)
+            ), current_row))
             
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
-                y=bb_middle,
+            x_ds, y_ds = downsample_lttb(ts, overlays['bb_middle'])
+            traces.append((go.Scattergl(
+                x=x_ds,
+                y=y_ds,
                 mode='lines',
                 name='BB Middle',
                 line=dict(color='gray')
-            ), row=current_row, col=1)
+            ), current_row))
     
     # Add volume
     if show_volume:
         current_row += 1
-        fig.add_trace(go.Bar(
-            x=df['timestamp'],
-            y=df['volume'],
+        x_ds, y_ds = downsample_bars(ts, df['volume'])  # mean hourly volume per bar
+        traces.append((go.Bar(
+            x=x_ds,
+            y=y_ds,
             name='Volume',
             marker_color='lightblue',
             opacity=0.7
-        ), row=current_row, col=1)
+        ), current_row))
     
-    # Add oscillator indicators
-    indicators_data = get_technical_indicators(df)
+    # Add oscillator indicators (only computed when one is selected)
+    indicators_data = get_technical_indicators(df) if oscillator_indicators else {}
     
-    for indicator in oscillator_indicators:
-        current_row += 1
-        
-        if indicator == "RSI" and indicators_data:
-            rsi_data = indicators_data.get('rsi', [])
-            if rsi_data:
-                fig.add_trace(go.Scatter(
-                    x=df['timestamp'],
-                    y=rsi_data,
-                    mode='lines',
-                    name='RSI',
-                    line=dict(color='purple')
-                ), row=current_row, col=1)
-                
-                # Add RSI levels
-                fig.add_hline(y=70, line_dash="dash", line_color="red", 
-                             annotation_text="Overbought", row=current_row, col=1)
-                fig.add_hline(y=30, line_dash="dash", line_color="green", 
-                             annotation_text="Oversold", row=current_row, col=1)
-        
-        elif indicator == "MACD" and indicators_data:
-            macd_line = indicators_data.get('macd_line', [])
-            macd_signal = indicators_data.get('macd_signal', [])
-            macd_histogram = indicators_data.get('macd_histogram', [])
-            
-            if macd_line:
-                fig.add_trace(go.Scatter(
-                    x=df['timestamp'],
-                    y=macd_line,
-                    mode='lines',
-                    name='MACD',
-                    line=dict(color='blue')
-                ), row=current_row, col=1)
-            
-            if macd_signal:
-                fig.add_trace(go.Scatter(
-                    x=df['timestamp'],
-                    y=macd_signal,
-                    mode='lines',
-                    name='Signal',
-                    line=dict(color='red')
-                ), row=current_row, col=1)
-            
-            if macd_histogram:
-                fig.add_trace(go.Bar(
-                    x=df['timestamp'],
-                    y=macd_histogram,
-                    name='Histogram',
-                    marker_color='gray',
-                    opacity=0.6
-                ), row=current_row, col=1)
+    oscillator_rows = list(enumerate(oscillator_indicators, start=current_row + 1))
+    
+    for row, indicator in oscillator_rows:
+        build_traces = OSCILLATOR_BUILDERS.get(indicator)
+        if build_traces and indicators_data:
+            traces.extend((trace, row) for trace in build_traces(ts, indicators_data))
+    
+    # One validation pass for every trace instead of one per add_trace()
+    if traces:
+        fig.add_traces(
+            [trace for trace, _ in traces],
+            rows=[row for _, row in traces],
+            cols=[1] * len(traces)
+        )
+    
+    # Reference levels go on after the traces (add_hline skips empty subplots)
+    for row, indicator in oscillator_rows:
+        for level, color, label in OSCILLATOR_LEVELS.get(indicator, []):
+            fig.add_hline(y=level, line_dash="dash", line_color=color, 
+                         annotation_text=label, row=row, col=1)
     
     # Apply chart style
     template = "plotly_white"
@@ -438,13 +437,75 @@ def create_professional_chart(df, chart_type, overlay_indicators, oscillator_ind
     
     return fig
 
-def render_indicators_tab(df):
+def _rsi_traces(ts, indicators_data):
+    """Build the RSI line for an oscillator subplot"""
+    rsi_data = indicators_data.get('rsi')
+    if rsi_data is None or not rsi_data.size:
+        return []
+    
+    x_ds, y_ds = downsample_lttb(ts, rsi_data)
+    return [go.Scattergl(
+        x=x_ds,
+        y=y_ds,
+        mode='lines',
+        name='RSI',
+        line=dict(color='purple')
+    )]
+
+def _macd_traces(ts, indicators_data):
+    """Build the MACD line, signal and histogram for an oscillator subplot"""
+    macd_line = indicators_data.get('macd_line')
+    macd_signal = indicators_data.get('macd_signal')
+    macd_histogram = indicators_data.get('macd_histogram')
+    traces = []
+    
+    if macd_line is not None and macd_line.size:
+        x_ds, y_ds = downsample_lttb(ts, macd_line)
+        traces.append(go.Scattergl(
+            x=x_ds,
+            y=y_ds,
+            mode='lines',
+            name='MACD',
+            line=dict(color='blue')
+        ))
+    
+    if macd_signal is not None and macd_signal.size:
+        x_ds, y_ds = downsample_lttb(ts, macd_signal)
+        traces.append(go.Scattergl(
+            x=x_ds,
+            y=y_ds,
+            mode='lines',
+            name='Signal',
+            line=dict(color='red')
+        ))
+    
+    if macd_histogram is not None and macd_histogram.size:
+        x_ds, y_ds = downsample_bars(ts, macd_histogram)
+        traces.append(go.Bar(
+            x=x_ds,
+            y=y_ds,
+            name='Histogram',
+            marker_color='gray',
+            opacity=0.6
+        ))
+    
+    return traces
+
+# Oscillator name -> subplot trace builder (unsupported oscillators keep an empty row)
+OSCILLATOR_BUILDERS = {
+    'RSI': _rsi_traces,
+    'MACD': _macd_traces
+}
+
+# Oscillator name -> horizontal reference levels (value, color, label)
+OSCILLATOR_LEVELS = {
+    'RSI': [(70, 'red', 'Overbought'), (30, 'green', 'Oversold')]
+}
+
+def render_indicators_tab(df, indicators):
     """Technical indicators detailed view"""
     st.subheader("📊 Technical Indicators Analysis")
     
-    # Get technical indicators
-    indicators = get_technical_indicators(df)
-    
     if not indicators:
         st.warning("Unable to calculate technical indicators")
         return
@@ -489,8 +550,11 @@ def render_analysis_tab(df):
     """Market analysis and insights"""
     st.subheader("🔍 Market Analysis")
     
-    # Price action analysis
-    stats = get_market_stats(df)
+    # Pull the columns once as arrays; slicing ndarrays avoids tail() copies
+    high = df['high'].to_numpy()
+    low = df['low'].to_numpy()
+    volume = df['volume'].to_numpy()
+    current_price = df['price'].to_numpy()[-1]
     
     col1, col2 = st.columns(2)
     
@@ -498,25 +562,23 @@ def render_analysis_tab(df):
         st.markdown("#### 📈 Price Action")
         
         # Support and resistance levels
-        recent_data = df.tail(100)
-        resistance = recent_data['high'].max()
-        support = recent_data['low'].min()
-        current_price = df['price'].iloc[-1]
+        resistance = high[-100:].max()
+        support = low[-100:].min()
         
         st.write(f"**Resistance:** ${resistance:.4f}")
         st.write(f"**Current:** ${current_price:.4f}")
         st.write(f"**Support:** ${support:.4f}")
         
         # Price position
-        position = (current_price - support) / (resistance - support)
+        position = float((current_price - support) / (resistance - support))
         st.progress(position)
         st.write(f"Price position: {position:.1%} of range")
     
     with col2:
         st.markdown("#### 📊 Volume Analysis")
         
-        avg_volume = df['volume'].tail(30).mean()
-        current_volume = df['volume'].iloc[-1]
+        avg_volume = volume[-30:].mean()
+        current_volume = volume[-1]
         volume_ratio = current_volume / avg_volume
         
         st.metric("Volume vs 30D Avg", f"{volume_ratio:.2f}x")
@@ -579,6 +641,7 @@ def render_market_statistics(df):
     st.subheader("📊 Market Statistics")
     
     stats = get_market_stats(df)
+    formatted = stats.get('formatted') or format_market_stats({})
     
     # Main statistics
     col1, col2, col3, col4, col5 = st.columns(5)
@@ -586,36 +649,38 @@ def render_market_statistics(df):
     with col1:
         st.metric(
             "Current Price", 
-            f"${stats.get('current_price', 0):.4f}",
-            delta=f"{stats.get('price_change_24h', 0):+.2f}%"
+            formatted['current_price'],
+            delta=formatted['price_change_24h']
         )
     
     with col2:
-        st.metric("24h High", f"${stats.get('high_24h', 0):.4f}")
+        st.metric("24h High", formatted['high_24h'])
     
     with col3:
-        st.metric("24h Low", f"${stats.get('low_24h', 0):.4f}")
+        st.metric("24h Low", formatted['low_24h'])
     
     with col4:
-        st.metric("24h Volume", f"${stats.get('volume_24h', 0)/1000000:.1f}M")
+        st.metric("24h Volume", formatted['volume_24h_m'])
     
     with col5:
-        st.metric("Market Cap", f"${stats.get('market_cap', 0):.1f}B")
+        st.metric("Market Cap", formatted['market_cap'])
 
 def render_rsi_chart(df, indicators):
     """Render RSI indicator chart"""
     st.markdown("#### RSI (Relative Strength Index)")
     
-    rsi_data = indicators.get('rsi', [])
-    if not rsi_data:
+    rsi_data = indicators.get('rsi')
+    if rsi_data is None or not rsi_data.size:
         st.warning("RSI data not available")
         return
     
     fig = go.Figure()
+    ts = df['timestamp'].to_numpy()
     
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=rsi_data,
+    x_ds, y_ds = downsample_lttb(ts, rsi_data)
+    fig.add_trace(go.Scattergl(
+        x=x_ds,
+        y=y_ds,
         mode='lines',
         name='RSI',
         line=dict(color='purple', width=2)
@@ -644,41 +709,45 @@ def render_macd_chart(df, indicators):
     """Render MACD indicator chart"""
     st.markdown("#### MACD (Moving Average Convergence Divergence)")
     
-    macd_line = indicators.get('macd_line', [])
-    macd_signal = indicators.get('macd_signal', [])
-    macd_histogram = indicators.get('macd_histogram', [])
+    macd_line = indicators.get('macd_line')
+    macd_signal = indicators.get('macd_signal')
+    macd_histogram = indicators.get('macd_histogram')
     
-    if not macd_line:
+    if macd_line is None or not macd_line.size:
         st.warning("MACD data not available")
         return
     
     fig = go.Figure()
+    ts = df['timestamp'].to_numpy()
     
     # MACD line
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=macd_line,
+    x_ds, y_ds = downsample_lttb(ts, macd_line)
+    fig.add_trace(go.Scattergl(
+        x=x_ds,
+        y=y_ds,
         mode='lines',
         name='MACD',
         line=dict(color='blue', width=2)
     ))
     
     # Signal line
-    if macd_signal:
-        fig.add_trace(go.Scatter(
-            x=df['timestamp'],
-            y=macd_signal,
+    if macd_signal is not None and macd_signal.size:
+        x_ds, y_ds = downsample_lttb(ts, macd_signal)
+        fig.add_trace(go.Scattergl(
+            x=x_ds,
+            y=y_ds,
             mode='lines',
             name='Signal',
             line=dict(color='red', width=2)
         ))
     
     # Histogram
-    if macd_histogram:
-        colors = ['green' if h > 0 else 'red' for h in macd_histogram]
+    if macd_histogram is not None and macd_histogram.size:
+        x_ds, y_ds = downsample_bars(ts, macd_histogram)
+        colors = np.where(y_ds > 0, 'green', 'red')
         fig.add_trace(go.Bar(
-            x=df['timestamp'],
-            y=macd_histogram,
+            x=x_ds,
+            y=y_ds,
             name='Histogram',
             marker_color=colors,
             opacity=0.6
@@ -699,38 +768,43 @@ def render_bollinger_chart(df, indicators):
     """Render Bollinger Bands chart"""
     st.markdown("#### Bollinger Bands")
     
-    bb_upper = indicators.get('bb_upper', [])
-    bb_middle = indicators.get('bb_middle', [])
-    bb_lower = indicators.get('bb_lower', [])
+    bb_upper = indicators.get('bb_upper')
+    bb_middle = indicators.get('bb_middle')
+    bb_lower = indicators.get('bb_lower')
     
-    if not bb_upper:
+    if bb_upper is None or not bb_upper.size:
         st.warning("Bollinger Bands data not available")
         return
     
     fig = go.Figure()
+    ts = df['timestamp'].to_numpy()
+    price = df['price'].to_numpy()
     
     # Price
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=df['price'],
+    x_ds, y_ds = downsample_lttb(ts, price)
+    fig.add_trace(go.Scattergl(
+        x=x_ds,
+        y=y_ds,
         mode='lines',
         name='Price',
         line=dict(color='blue', width=2)
     ))
     
     # Upper band
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=bb_upper,
+    x_ds, y_ds = downsample_lttb(ts, bb_upper)
+    fig.add_trace(go.Scattergl(
+        x=x_ds,
+        y=y_ds,
         mode='lines',
         name='Upper Band',
         line=dict(color='red', dash='dash')
     ))
     
     # Lower band
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=bb_lower,
+    x_ds, y_ds = downsample_lttb(ts, bb_lower)
+    fig.add_trace(go.Scattergl(
+        x=x_ds,
+        y=y_ds,
         mode='lines',
         name='Lower Band',
         line=dict(color='green', dash='dash'),
@@ -739,9 +813,10 @@ def render_bollinger_chart(df, indicators):
     ))
     
     # Middle band
-    fig.add_trace(go.Scatter(
-        x=df['timestamp'],
-        y=bb_middle,
+    x_ds, y_ds = downsample_lttb(ts, bb_middle)
+    fig.add_trace(go.Scattergl(
+        x=x_ds,
+        y=y_ds,
         mode='lines',
         name='Middle Band (SMA 20)',
         line=dict(color='orange')
@@ -9,18 +9,32 @@ import pandas as pd
 import json
 from datetime import datetime, timedelta
 import io
+import hashlib
 
 # Import utilities
 from utils.auth import get_current_user, require_authentication_for_premium
-from utils.data import fetch_kaspa_price_data, get_market_stats
+from utils.data import (
+    fetch_kaspa_price_data, get_market_stats, export_data_to_json,
+    EXPORT_RANGE_DAYS, _price_frame_fingerprint
+)
 from utils.ui import (
     render_page_header, 
     render_sidebar_navigation,
     apply_custom_css,
+    render_seo_meta,
     render_footer,
     show_premium_required_prompt
 )
 
+# Static SEO meta tags for this page
+SEO_META_HTML = """
+<meta name="description" content="Export Kaspa price data, network metrics, and technical indicators in CSV or JSON format. Premium feature.">
+<meta name="keywords" content="Kaspa data export, KAS price data download, cryptocurrency data API">
+<meta property="og:title" content="Kaspa Data Export - Premium Feature">
+<meta property="og:description" content="Download Kaspa blockchain data in multiple formats with Premium subscription">
+<meta property="og:type" content="website">
+"""
+
 # Configure page
 st.set_page_config(
     page_title="Data Export - Kaspa Analytics Pro",
@@ -30,13 +44,7 @@ st.set_page_config(
 )
 
 # SEO Meta Tags
-st.markdown("""
-<meta name="description" content="Export Kaspa price data, network metrics, and technical indicators in CSV or JSON format. Premium feature.">
-<meta name="keywords" content="Kaspa data export, KAS price data download, cryptocurrency data API">
-<meta property="og:title" content="Kaspa Data Export - Premium Feature">
-<meta property="og:description" content="Download Kaspa blockchain data in multiple formats with Premium subscription">
-<meta property="og:type" content="website">
-""", unsafe_allow_html=True)
+render_seo_meta(SEO_META_HTML)
 
 # Apply styling
 apply_custom_css()
@@ -144,7 +152,7 @@ def render_premium_export_page(user):
     elif export_tabs == 'Network Data':
         render_network_data_export()
     else:
-        render_api_access_tab()
+        render_api_access_tab(user)
     
     # Export history
     st.markdown("---")
@@ -200,26 +208,22 @@ def render_price_data_export():
     # Preview data
     st.markdown("#### 👀 Data Preview")
     
-    # Fetch data based on selection
-    if date_option == "Last 7 days":
-        df = fetch_kaspa_price_data(7)
-    elif date_option == "Last 30 days":
-        df = fetch_kaspa_price_data(30)
-    elif date_option == "Last 3 months":
-        df = fetch_kaspa_price_data(90)
-    elif date_option == "Last 6 months":
-        df = fetch_kaspa_price_data(180)
-    elif date_option == "Last year":
-        df = fetch_kaspa_price_data(365)
+    # Fetch data based on selection (cached per day count)
+    if date_option == "Custom range":
+        days = (end_date - start_date).days
     else:
-        # Custom range
-        days_diff = (end_date - start_date).days
-        df = fetch_kaspa_price_data(days_diff)
+        days = EXPORT_RANGE_DAYS[date_option]
+    
+    # One cached frame feeds the preview, the row count and the download
+    df = fetch_kaspa_price_data(days)
     
     if not df.empty:
+        head_df = df.head(10)
+        
         # Filter columns
-        available_columns = [col for col in data_columns if col.lower() in df.columns]
-        preview_df = df[available_columns].head(10)
+        wanted = pd.Index([col.lower() for col in data_columns])
+        available_columns = wanted.intersection(head_df.columns, sort=False).tolist()
+        preview_df = head_df.loc[:, available_columns]
         
         st.dataframe(preview_df, use_container_width=True)
         st.info(f"📊 Total rows: {len(df):,} | Preview showing first 10 rows")
@@ -230,21 +234,22 @@ def render_price_data_export():
         with col1:
             if st.button("📥 Download Data", key="download_price_data", use_container_width=True, type="primary"):
                 # Generate download
+                export_time = datetime.now().strftime('%Y%m%d_%H%M%S')
+                export_data = serialize_price_export(df, tuple(available_columns), export_format, include_headers)
+                
                 if export_format == "CSV":
-                    csv_data = df[available_columns].to_csv(index=False, header=include_headers)
                     st.download_button(
                         label="💾 Download CSV",
-                        data=csv_data,
-                        file_name=f"kaspa_price_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv",
+                        data=export_data,
+                        file_name=f"kaspa_price_data_{export_time}.csv",
+                        mime="text/csv; charset=utf-8",
                         key="csv_download"
                     )
                 else:
-                    json_data = df[available_columns].to_json(orient='records', date_format='iso')
                     st.download_button(
                         label="💾 Download JSON",
-                        data=json_data,
-                        file_name=f"kaspa_price_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                        data=export_data,
+                        file_name=f"kaspa_price_data_{export_time}.json",
                         mime="application/json",
                         key="json_download"
                     )
@@ -257,8 +262,43 @@ def render_price_data_export():
         
         with col3:
             if st.button("🔄 Refresh Data", key="refresh_price_data", use_container_width=True):
+                # Drop cached prices and the exports serialized from them, then redraw
+                fetch_kaspa_price_data.clear()
+                serialize_price_export.clear()
                 st.rerun()
 
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False, hash_funcs={pd.DataFrame: _price_frame_fingerprint})
+def serialize_price_export(df: pd.DataFrame, columns: tuple, export_format: str, include_headers: bool):
+    """Serialize a price export, reused when the same frame/columns/format is downloaded again"""
+    if export_format == "CSV":
+        # Write straight to a byte buffer in chunks rather than one large str
+        buffer = io.BytesIO()
+        df[list(columns)].to_csv(buffer, index=False, header=include_headers, chunksize=10_000)
+        return buffer.getvalue()
+    return export_data_to_json(df[list(columns)])
+
+@st.cache_resource(show_spinner=False)
+def get_technical_sample() -> pd.DataFrame:
+    """Static technical indicators preview, built once and shared read-only"""
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start='2024-01-01', periods=10, freq='D'),
+        'price': [0.1234, 0.1245, 0.1256, 0.1234, 0.1223, 0.1267, 0.1289, 0.1245, 0.1234, 0.1278],
+        'rsi': [45.2, 52.1, 58.3, 42.1, 38.9, 65.4, 72.1, 48.3, 41.2, 59.8],
+        'sma_20': [0.1240, 0.1242, 0.1244, 0.1243, 0.1241, 0.1245, 0.1248, 0.1247, 0.1245, 0.1250],
+        'macd': [0.0012, 0.0015, 0.0018, 0.0010, 0.0008, 0.0020, 0.0025, 0.0015, 0.0012, 0.0022]
+    })
+
+@st.cache_resource(show_spinner=False)
+def get_network_sample() -> pd.DataFrame:
+    """Static network metrics preview, built once and shared read-only"""
+    return pd.DataFrame({
+        'date': pd.date_range(start='2024-01-01', periods=7, freq='D'),
+        'hash_rate': [125.5, 128.2, 132.1, 129.8, 135.4, 140.2, 138.9],
+        'difficulty': [1.25e12, 1.28e12, 1.32e12, 1.29e12, 1.35e12, 1.40e12, 1.38e12],
+        'active_addresses': [15420, 16230, 17580, 15890, 18450, 19120, 18760],
+        'avg_block_time': [1.02, 0.98, 1.05, 1.01, 0.95, 1.08, 1.03]
+    })
+
 def render_technical_data_export():
     """Render technical indicators export"""
     st.subheader("📊 Technical Indicators Export")
@@ -297,15 +337,7 @@ def render_technical_data_export():
     # Sample technical data
     st.markdown("#### 👀 Technical Data Preview")
     
-    sample_data = {
-        'timestamp': pd.date_range(start='2024-01-01', periods=10, freq='D'),
-        'price': [0.1234, 0.1245, 0.1256, 0.1234, 0.1223, 0.1267, 0.1289, 0.1245, 0.1234, 0.1278],
-        'rsi': [45.2, 52.1, 58.3, 42.1, 38.9, 65.4, 72.1, 48.3, 41.2, 59.8],
-        'sma_20': [0.1240, 0.1242, 0.1244, 0.1243, 0.1241, 0.1245, 0.1248, 0.1247, 0.1245, 0.1250],
-        'macd': [0.0012, 0.0015, 0.0018, 0.0010, 0.0008, 0.0020, 0.0025, 0.0015, 0.0012, 0.0022]
-    }
-    
-    tech_df = pd.DataFrame(sample_data)
+    tech_df = get_technical_sample()
     st.dataframe(tech_df, use_container_width=True)
     
     # Export button
@@ -353,22 +385,19 @@ def render_network_data_export():
     # Sample network data
     st.markdown("#### 👀 Network Data Preview")
     
-    network_sample = {
-        'date': pd.date_range(start='2024-01-01', periods=7, freq='D'),
-        'hash_rate': [125.5, 128.2, 132.1, 129.8, 135.4, 140.2, 138.9],
-        'difficulty': [1.25e12, 1.28e12, 1.32e12, 1.29e12, 1.35e12, 1.40e12, 1.38e12],
-        'active_addresses': [15420, 16230, 17580, 15890, 18450, 19120, 18760],
-        'avg_block_time': [1.02, 0.98, 1.05, 1.01, 0.95, 1.08, 1.03]
-    }
-    
-    network_df = pd.DataFrame(network_sample)
+    network_df = get_network_sample()
     st.dataframe(network_df, use_container_width=True)
     
     # Export button
     if st.button("📥 Export Network Data", key="export_network_data", use_container_width=True, type="primary"):
         st.success("✅ Network metrics exported successfully!")
 
-def render_api_access_tab():
+@st.cache_data(show_spinner=False)
+def get_api_key(username: str) -> str:
+    """Derive the user's display API key from a short hash of the username"""
+    return f"kas_pro_{username}_{hashlib.blake2b(username.encode(), digest_size=6).hexdigest()}"
+
+def render_api_access_tab(user):
     """Render API access information"""
     st.subheader("🔌 API Access")
     
@@ -377,7 +406,7 @@ def render_api_access_tab():
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        api_key = "kas_pro_" + user['username'] + "_" + "".join([str(ord(c)) for c in user['username'][:3]])
+        api_key = get_api_key(user['username'])
         st.code(api_key, language="text")
     
     with col2:
@@ -444,20 +473,22 @@ data = response.json()
 print(data)
     """, language="python")
 
-def render_export_history():
-    """Render export history for user"""
-    st.subheader("📋 Export History")
-    
-    # Sample export history
-    export_history = [
+@st.cache_resource(show_spinner=False)
+def get_export_history() -> pd.DataFrame:
+    """Sample export history table, built once and shared read-only"""
+    return pd.DataFrame([
         {"date": "2024-01-15 14:30", "type": "Price Data", "format": "CSV", "rows": "8,760", "status": "✅ Complete"},
         {"date": "2024-01-14 09:15", "type": "Technical Data", "format": "JSON", "rows": "2,190", "status": "✅ Complete"},
         {"date": "2024-01-13 16:45", "type": "Network Data", "format": "CSV", "rows": "720", "status": "✅ Complete"},
         {"date": "2024-01-12 11:20", "type": "API Request", "format": "JSON", "rows": "1,440", "status": "✅ Complete"},
-    ]
+    ])
+
+def render_export_history():
+    """Render export history for user"""
+    st.subheader("📋 Export History")
     
-    # Create history table
-    history_df = pd.DataFrame(export_history)
+    # Sample export history table
+    history_df = get_export_history()
     st.dataframe(history_df, use_container_width=True, hide_index=True)
     
     col1, col2 = st.columns(2)
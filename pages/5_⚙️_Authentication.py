@@ -5,6 +5,7 @@ Handles login, registration, user profile, and account management
 
 import streamlit as st
 import streamlit_antd_components as sac
+import pandas as pd
 from datetime import datetime
 
 # Import utilities
@@ -705,6 +706,17 @@ def render_settings_tab(user):
     if st.button("💾 Save All Settings", key="save_settings", type="primary"):
         st.success("✅ Settings saved successfully!")
 
+@st.cache_resource(show_spinner=False)
+def get_account_activity():
+    """Sample account activity table, built once and shared read-only"""
+    return pd.DataFrame([
+        ("2 hours ago", "Viewed Power Law analysis", "Power Law"),
+        ("1 day ago", "Exported price data", "Data Export"),
+        ("3 days ago", "Updated profile settings", "Profile"),
+        ("1 week ago", "Logged in", "Dashboard"),
+        ("2 weeks ago", "Created account", "Registration"),
+    ], columns=["time", "action", "page"])
+
 def render_activity_tab(user):
     """User activity and statistics"""
     st.markdown("### 📊 Account Activity")
@@ -730,23 +742,7 @@ def render_activity_tab(user):
     # Activity timeline
     st.markdown("### 📅 Recent Activity")
     
-    activity_data = [
-        {"time": "2 hours ago", "action": "Viewed Power Law analysis", "page": "Power Law"},
-        {"time": "1 day ago", "action": "Exported price data", "page": "Data Export"},
-        {"time": "3 days ago", "action": "Updated profile settings", "page": "Profile"},
-        {"time": "1 week ago", "action": "Logged in", "page": "Dashboard"},
-        {"time": "2 weeks ago", "action": "Created account", "page": "Registration"},
-    ]
-    
-    for activity in activity_data:
-        with st.container():
-            col1, col2, col3 = st.columns([2, 4, 2])
-            with col1:
-                st.write(activity["time"])
-            with col2:
-                st.write(activity["action"])
-            with col3:
-                st.write(activity["page"])
+    st.dataframe(get_account_activity(), use_container_width=True, hide_index=True)
     
     # Feature usage
     st.markdown("### 🎯 Feature Usage")
@@ -19,31 +19,28 @@ except ImportError:
 
 # Import utilities
 from utils.auth import get_current_user, is_authenticated
-from utils.data import fetch_kaspa_price_data, get_market_stats
+from utils.data import (
+    fetch_kaspa_price_data,
+    get_market_stats,
+    format_market_stats,
+    downsample_lttb,
+    downsample_bars
+)
 from utils.ui import (
     render_page_header, 
     render_sidebar_navigation, 
     show_create_account_prompt,
     apply_custom_css,
+    render_seo_meta,
     render_footer
 )
-from utils.config import get_app_config
+from utils.config import get_app_config, PAGES
 
-# Configure page settings
-st.set_page_config(
-    page_title="Kaspa Analytics Pro - Professional Blockchain Analysis",
-    page_icon="💎",
-    layout="wide",
-    initial_sidebar_state="expanded",
-    menu_items={
-        'Get Help': 'https://kaspa-analytics.com/help',
-        'Report a bug': 'https://kaspa-analytics.com/bug-report',
-        'About': "# Kaspa Analytics Pro\nProfessional blockchain analysis platform"
-    }
-)
+# Maximum points per homepage chart trace
+HOME_CHART_MAX_POINTS = 500
 
-# SEO and Social Media Meta Tags
-st.markdown("""
+# SEO and social media meta tags plus the Google Analytics (placeholder) snippet
+HEAD_HTML = """
 <meta name="description" content="Professional Kaspa blockchain analysis platform with advanced power law models, network metrics, and real-time price tracking.">
 <meta name="keywords" content="Kaspa, KAS, blockchain, cryptocurrency, analysis, power law, price prediction, technical analysis">
 <meta name="author" content="Kaspa Analytics Pro">
@@ -64,13 +61,7 @@ st.markdown("""
 
 <!-- Favicon -->
 <link rel="icon" type="image/png" href="/assets/favicon.ico">
-""", unsafe_allow_html=True)
 
-# Apply custom CSS
-apply_custom_css()
-
-# Google Analytics (placeholder)
-st.markdown("""
 <!-- Google Analytics -->
 <script async src="https://www.googletagmanager.com/gtag/js?id=GA_MEASUREMENT_ID"></script>
 <script>
@@ -79,7 +70,26 @@ st.markdown("""
   gtag('js', new Date());
   gtag('config', 'GA_MEASUREMENT_ID');
 </script>
-""", unsafe_allow_html=True)
+"""
+
+# Configure page settings
+st.set_page_config(
+    page_title="Kaspa Analytics Pro - Professional Blockchain Analysis",
+    page_icon="💎",
+    layout="wide",
+    initial_sidebar_state="expanded",
+    menu_items={
+        'Get Help': 'https://kaspa-analytics.com/help',
+        'Report a bug': 'https://kaspa-analytics.com/bug-report',
+        'About': "# Kaspa Analytics Pro\nProfessional blockchain analysis platform"
+    }
+)
+
+# SEO, social meta tags and Google Analytics, sent as one cached element
+render_seo_meta(HEAD_HTML)
+
+# Apply custom CSS
+apply_custom_css()
 
 def main():
     """Main homepage function"""
@@ -92,16 +102,20 @@ def main():
     # Render sidebar navigation
     render_sidebar_navigation(user)
     
+    # Get market data once for whichever homepage is shown
+    df = fetch_kaspa_price_data()
+    stats = get_market_stats(df) if not df.empty else {}
+    
     # Main content
     if is_auth:
-        render_authenticated_homepage(user)
+        render_authenticated_homepage(user, df, stats)
     else:
-        render_public_homepage()
+        render_public_homepage(df, stats)
     
     # Footer
     render_footer()
 
-def render_public_homepage():
+def render_public_homepage(df, stats):
     """Public homepage for non-authenticated users"""
     
     # Hero section
@@ -114,65 +128,21 @@ def render_public_homepage():
     # Key metrics showcase
     st.subheader("📊 Live Market Data")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    # Get market data
-    df = fetch_kaspa_price_data()
-    stats = get_market_stats(df) if not df.empty else {}
-    
-    with col1:
-        st.metric(
-            "KAS Price", 
-            f"${stats.get('current_price', 0):.4f}",
-            delta=f"{stats.get('price_change_7d', 0):+.2f}%"
-        )
+    kpis = get_market_kpis(stats)
+    tiles = [
+        ("KAS Price", kpis['current_price'], kpis['price_change_7d']),
+        ("24h Volume", kpis['volume_24h'], None),
+        ("Market Cap", kpis['market_cap'], None),
+        ("Network Hash Rate", kpis['hash_rate'], None)
+    ]
     
-    with col2:
-        st.metric(
-            "24h Volume", 
-            f"${stats.get('volume_24h', 0):,.0f}"
-        )
-    
-    with col3:
-        st.metric(
-            "Market Cap", 
-            f"${stats.get('market_cap', 0):.1f}B"
-        )
-    
-    with col4:
-        st.metric(
-            "Network Hash Rate", 
-            f"{stats.get('hash_rate', 0):.2f} EH/s"
-        )
+    for col, (label, value, delta) in zip(st.columns(4), tiles):
+        col.metric(label, value, delta=delta)
     
     # Quick chart preview
     if not df.empty:
         st.subheader("📈 Price Chart Preview")
-        chart_data = df.tail(30)  # 30 days for public preview
-        
-        if PLOTLY_AVAILABLE:
-            fig = go.Figure()
-            fig.add_trace(go.Scatter(
-                x=chart_data['timestamp'], 
-                y=chart_data['price'],
-                mode='lines',
-                name='KAS Price',
-                line=dict(color='#70C7BA', width=3)
-            ))
-            
-            fig.update_layout(
-                title="Kaspa Price - Last 30 Days (Free Access)",
-                xaxis_title="Date",
-                yaxis_title="Price (USD)",
-                height=400,
-                template="plotly_white",
-                showlegend=False
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            # Fallback to basic line chart
-            st.line_chart(chart_data.set_index('timestamp')['price'])
+        render_price_chart_preview(df)
         
         st.info("📊 All charts and analysis tools are free! Only data export requires Premium.")
     
@@ -223,13 +193,13 @@ def render_public_homepage():
             st.write("• 📊 Advanced analytics")
             
             if st.button("⭐ Upgrade to Premium", key="pricing_premium", use_container_width=True):
-                st.switch_page("pages/5_⚙️_Authentication.py")
+                st.switch_page(PAGES['auth'])
     
     # Call to action for account creation
     st.markdown("---")
     show_create_account_prompt()
 
-def render_authenticated_homepage(user):
+def render_authenticated_homepage(user, df, stats):
     """Authenticated user dashboard"""
     
     subscription = user['subscription']
@@ -242,84 +212,24 @@ def render_authenticated_homepage(user):
     )
     
     # Quick stats dashboard
-    col1, col2, col3, col4 = st.columns(4)
-    
-    df = fetch_kaspa_price_data()
-    stats = get_market_stats(df) if not df.empty else {}
-    
-    with col1:
-        st.metric(
-            "KAS Price", 
-            f"${stats.get('current_price', 0):.4f}",
-            delta=f"{stats.get('price_change_24h', 0):+.2f}%"
-        )
-    
-    with col2:
-        st.metric("Your Plan", subscription.title())
-    
-    with col3:
-        st.metric("All Features", "✅ Unlocked")
+    kpis = get_market_kpis(stats)
+    tiles = [
+        ("KAS Price", kpis['current_price'], kpis['price_change_24h']),
+        ("Your Plan", subscription.title(), None),
+        ("All Features", "✅ Unlocked", None),
+        ("Data Export", "✅ Available" if subscription == 'premium' else "⭐ Upgrade to Premium", None)
+    ]
     
-    with col4:
-        if subscription == 'premium':
-            st.metric("Data Export", "✅ Available")
-        else:
-            st.metric("Data Export", "⭐ Upgrade to Premium")
+    for col, (label, value, delta) in zip(st.columns(4), tiles):
+        col.metric(label, value, delta=delta)
     
     # Enhanced chart for authenticated users
     if not df.empty:
         st.subheader("📈 Price Analysis Dashboard")
         
-        chart_data = df.tail(365)  # 1 year for all users
         st.success(f"📊 {subscription.title()} account: Full access to all analytics tools")
         
-        # Create advanced chart
-        fig = go.Figure()
-        
-        # Price line
-        fig.add_trace(go.Scatter(
-            x=chart_data['timestamp'], 
-            y=chart_data['price'],
-            mode='lines',
-            name='KAS Price',
-            line=dict(color='#70C7BA', width=2)
-        ))
-        
-        # Add volume
-        if PLOTLY_AVAILABLE:
-            fig.add_trace(go.Scatter(
-                x=chart_data['timestamp'],
-                y=chart_data['volume'] / 1000000,  # Scale volume
-                mode='lines',
-                name='Volume (M)',
-                yaxis='y2',
-                opacity=0.6,
-                line=dict(color='orange')
-            ))
-            
-            # Add secondary y-axis
-            fig.update_layout(
-                yaxis2=dict(
-                    title="Volume (Millions)",
-                    overlaying='y',
-                    side='right',
-                    showgrid=False
-                )
-            )
-        
-        if PLOTLY_AVAILABLE:
-            fig.update_layout(
-                title=f"Kaspa Price Analysis - {subscription.title()} View",
-                xaxis_title="Date",
-                yaxis_title="Price (USD)",
-                height=500,
-                template="plotly_white"
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            # Fallback to basic chart
-            st.line_chart(chart_data.set_index('timestamp')['price'])
+        render_price_dashboard_chart(df, subscription)
     
     # Quick actions dashboard
     st.subheader("⚡ Quick Actions")
@@ -328,42 +238,126 @@ def render_authenticated_homepage(user):
     
     with action_cols[0]:
         if st.button("📈 Price Charts", key="dash_charts", use_container_width=True):
-            st.switch_page("pages/1_📈_Price_Charts.py")
+            st.switch_page(PAGES['charts'])
     
     with action_cols[1]:
         if st.button("📊 Power Law Analysis", key="dash_powerlaw", use_container_width=True):
-            st.switch_page("pages/2_📊_Power_Law.py")
+            st.switch_page(PAGES['power_law'])
     
     with action_cols[2]:
         if st.button("🌐 Network Metrics", key="dash_network", use_container_width=True):
-            st.switch_page("pages/3_🌐_Network_Metrics.py")
+            st.switch_page(PAGES['network'])
     
     with action_cols[3]:
         if subscription == 'premium':
             if st.button("📋 Data Export", key="dash_export", use_container_width=True):
-                st.switch_page("pages/4_📋_Data_Export.py")
+                st.switch_page(PAGES['export'])
         else:
             if st.button("⭐ Get Premium", key="dash_premium", use_container_width=True):
-                st.switch_page("pages/5_⚙️_Authentication.py")
+                st.switch_page(PAGES['auth'])
     
     # Recent activity (placeholder)
     st.subheader("📋 Recent Activity")
     
-    activity_data = [
+    st.dataframe(get_recent_activity(), use_container_width=True, hide_index=True)
+
+def get_market_kpis(stats):
+    """Formatted KPI strings for a market stats dict (zeros when stats are unavailable)"""
+    return stats.get('formatted') or format_market_stats({})
+
+@st.cache_resource(show_spinner=False)
+def get_recent_activity():
+    """Sample recent activity table, built once and shared read-only"""
+    return pd.DataFrame([
         {"time": "2 hours ago", "action": "Viewed price charts", "status": "✅"},
         {"time": "1 day ago", "action": "Analyzed power law model", "status": "✅"},
         {"time": "3 days ago", "action": "Checked network metrics", "status": "✅"},
-    ]
+    ], columns=["time", "action", "status"])
+
+def render_price_chart_preview(df):
+    """Public 30-day price preview"""
+    # Array views of the last 30 rows for the public preview (no frame copy)
+    ts = df['timestamp'].to_numpy()[-30:]
+    price = df['price'].to_numpy()[-30:]
+    
+    if not PLOTLY_AVAILABLE:
+        # Fallback to basic line chart
+        st.line_chart(pd.Series(price, index=ts))
+        return
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=ts, 
+        y=price,
+        mode='lines',
+        name='KAS Price',
+        line=dict(color='#70C7BA', width=3)
+    ))
+    
+    fig.update_layout(
+        title="Kaspa Price - Last 30 Days (Free Access)",
+        xaxis_title="Date",
+        yaxis_title="Price (USD)",
+        height=400,
+        template="plotly_white",
+        showlegend=False
+    )
     
-    for activity in activity_data:
-        with st.container():
-            col1, col2, col3 = st.columns([2, 4, 1])
-            with col1:
-                st.write(activity["time"])
-            with col2:
-                st.write(activity["action"])
-            with col3:
-                st.write(activity["status"])
+    st.plotly_chart(fig, use_container_width=True, key="home_price_preview")
+
+@st.fragment
+def render_price_dashboard_chart(df, subscription):
+    """Dashboard price/volume chart, isolated as a fragment"""
+    # Array views of the last 365 rows for all users (no frame copy)
+    ts = df['timestamp'].to_numpy()[-365:]
+    price = df['price'].to_numpy()[-365:]
+    
+    if not PLOTLY_AVAILABLE:
+        # Fallback to basic chart
+        st.line_chart(pd.Series(price, index=ts))
+        return
+    
+    # Create advanced chart
+    fig = go.Figure()
+    
+    # Price line (LTTB keeps the shape while capping the points sent to the browser)
+    x_ds, y_ds = downsample_lttb(ts, price, n_out=HOME_CHART_MAX_POINTS)
+    fig.add_trace(go.Scattergl(
+        x=x_ds, 
+        y=y_ds,
+        mode='lines',
+        name='KAS Price',
+        line=dict(color='#70C7BA', width=2)
+    ))
+    
+    # Add volume (averaged per bucket rather than LTTB-picked, so no hours drop out)
+    x_ds, y_ds = downsample_bars(ts, df['volume_m'].to_numpy()[-365:], n_out=HOME_CHART_MAX_POINTS)
+    fig.add_trace(go.Scattergl(
+        x=x_ds,
+        y=y_ds,  # Scaled volume
+        mode='lines',
+        name='Volume (M)',
+        yaxis='y2',
+        opacity=0.6,
+        line=dict(color='orange')
+    ))
+    
+    # Layout with a secondary y-axis for volume
+    fig.update_layout(
+        title=f"Kaspa Price Analysis - {subscription.title()} View",
+        xaxis_title="Date",
+        yaxis_title="Price (USD)",
+        yaxis2=dict(
+            title="Volume (Millions)",
+            overlaying='y',
+            side='right',
+            showgrid=False
+        ),
+        height=500,
+        template="plotly_white"
+    )
+    
+    st.plotly_chart(fig, use_container_width=True, key="home_price_dashboard")
 
 def render_free_features_showcase():
     """Show what's available for free"""
@@ -378,7 +372,7 @@ def render_free_features_showcase():
         st.write("• **Real-time Updates**: Live market data")
         
         if st.button("📈 Try Price Charts", key="try_charts", use_container_width=True):
-            st.switch_page("pages/1_📈_Price_Charts.py")
+            st.switch_page(PAGES['charts'])
     
     with col2:
         st.markdown("#### 🔬 Advanced Analytics")
@@ -389,7 +383,7 @@ def render_free_features_showcase():
         st.write("• **Volume Analysis**: Trading volume insights")
         
         if st.button("📊 Try Power Law", key="try_powerlaw", use_container_width=True):
-            st.switch_page("pages/2_📊_Power_Law.py")
+            st.switch_page(PAGES['power_law'])
 
 def render_premium_features_showcase():
     """Show premium features"""
@@ -411,7 +405,7 @@ def render_premium_features_showcase():
     
     st.markdown("---")
     if st.button("⭐ Upgrade to Premium - $29/month", key="upgrade_premium_showcase", use_container_width=True, type="primary"):
-        st.switch_page("pages/5_⚙️_Authentication.py")
+        st.switch_page(PAGES['auth'])
 
 def render_getting_started_showcase():
     """Show getting started guide"""
@@ -434,11 +428,11 @@ def render_getting_started_showcase():
     
     with col1:
         if st.button("📈 Start with Charts", key="start_charts", use_container_width=True, type="primary"):
-            st.switch_page("pages/1_📈_Price_Charts.py")
+            st.switch_page(PAGES['charts'])
     
     with col2:
         if st.button("🚀 Create Account", key="start_account", use_container_width=True):
-            st.switch_page("pages/5_⚙️_Authentication.py")
+            st.switch_page(PAGES['auth'])
 
 if __name__ == "__main__":
     main()
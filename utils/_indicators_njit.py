@@ -0,0 +1,112 @@
+"""
+JIT-compiled indicator kernels for Kaspa Analytics Pro
+Single-pass SMA, EMA and rolling mean/std calculations over float64 NumPy arrays
+"""
+
+import numpy as np
+
+# Try to import Numba, fallback to plain Python kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _njit(*args, **kwargs):
+    """Compile with numba.njit when available, otherwise return the function unchanged"""
+    if NUMBA_AVAILABLE:
+        return njit(*args, **kwargs)
+
+    def decorator(func):
+        return func
+
+    return decorator
+
+@_njit(cache=True)
+def sma(x, window):
+    """Simple moving average (NaN until the window is full, like pandas rolling().mean())"""
+    n = x.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    total = 0.0
+
+    for i in range(n):
+        total += x[i]
+        if i >= window:
+            total -= x[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+        else:
+            out[i] = np.nan
+
+    return out
+
+@_njit(cache=True)
+def ewm(x, span):
+    """Exponential moving average matching pandas ewm(span=span, adjust=True).mean()"""
+    n = x.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = 0.0
+    denominator = 0.0
+
+    for i in range(n):
+        numerator = x[i] + decay * numerator
+        denominator = 1.0 + decay * denominator
+        out[i] = numerator / denominator
+
+    return out
+
+@_njit(cache=True)
+def rolling_mean_std(x, window):
+    """
+    Rolling mean and sample std (ddof=1) in one sliding-window Welford pass
+    Matches pandas rolling().mean() / rolling().std(), NaN until the window is full
+    """
+    n = x.shape[0]
+    means = np.empty(n, dtype=np.float64)
+    stds = np.empty(n, dtype=np.float64)
+    mean = 0.0
+    m2 = 0.0
+
+    for i in range(n):
+        if i < window:
+            delta = x[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x[i] - mean)
+        else:
+            old = x[i - window]
+            old_mean = mean
+            mean += (x[i] - old) / window
+            m2 += (x[i] - old) * (x[i] - mean + old - old_mean)
+
+        if i >= window - 1:
+            means[i] = mean
+            stds[i] = np.sqrt(max(m2, 0.0) / (window - 1))
+        else:
+            means[i] = np.nan
+            stds[i] = np.nan
+
+    return means, stds
+
+@_njit(cache=True)
+def ema_pair(x, span_fast, span_slow):
+    """Two adjust=True EMAs (e.g. 12/26 for MACD) emitted from a single pass over x"""
+    n = x.shape[0]
+    fast = np.empty(n, dtype=np.float64)
+    slow = np.empty(n, dtype=np.float64)
+    decay_fast = 1.0 - 2.0 / (span_fast + 1.0)
+    decay_slow = 1.0 - 2.0 / (span_slow + 1.0)
+    num_fast = 0.0
+    den_fast = 0.0
+    num_slow = 0.0
+    den_slow = 0.0
+
+    for i in range(n):
+        num_fast = x[i] + decay_fast * num_fast
+        den_fast = 1.0 + decay_fast * den_fast
+        num_slow = x[i] + decay_slow * num_slow
+        den_slow = 1.0 + decay_slow * den_slow
+        fast[i] = num_fast / den_fast
+        slow[i] = num_slow / den_slow
+
+    return fast, slow
@@ -6,59 +6,156 @@ Handles user authentication, session management, and authorization
 import streamlit as st
 import streamlit_authenticator as stauth
 import yaml
-from yaml.loader import SafeLoader
+# Prefer the libyaml C loader, fallback to the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml.loader import SafeLoader
 import bcrypt
 from datetime import datetime
+import copy
+import logging
 import os
+import threading
+import time
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from utils.config import PAGES
 
-def get_auth_config():
-    """Get authentication configuration"""
-    config_path = Path("config/user_config.yaml")
-    
-    # Default configuration if file doesn't exist
-    default_config = {
-        'credentials': {
-            'usernames': {
-                'admin': {
-                    'email': 'admin@kaspalytics.com',
-                    'first_name': 'Admin',
-                    'last_name': 'User',
-                    'password': 'admin123',
-                    'subscription': 'premium',
-                    'failed_login_attempts': 0,
-                    'logged_in': False
-                },
-                'premium_user': {
-                    'email': 'premium@example.com',
-                    'first_name': 'Premium',
-                    'last_name': 'User',
-                    'password': 'premium123',
-                    'subscription': 'premium',
-                    'failed_login_attempts': 0,
-                    'logged_in': False
-                },
-                'free_user': {
-                    'email': 'free@example.com',
-                    'first_name': 'Free',
-                    'last_name': 'User',
-                    'password': 'free123',
-                    'subscription': 'free',
-                    'failed_login_attempts': 0,
-                    'logged_in': False
-                }
+# User store on disk
+AUTH_CONFIG_PATH = Path("config/user_config.yaml")
+
+# Guards the process-wide cached config: its mutations, saves and reloads
+_AUTH_CONFIG_LOCK = threading.RLock()
+
+# Seconds to wait before retrying a user store write that failed
+AUTH_CONFIG_RETRY_INTERVAL = 60
+
+logger = logging.getLogger(__name__)
+
+def _bcrypt_rounds(default=10):
+    """BCRYPT_ROUNDS from the environment, falling back to the default outside bcrypt's 4-31 range"""
+    try:
+        rounds = int(os.getenv('BCRYPT_ROUNDS', default))
+    except ValueError:
+        logger.warning("Ignoring non-integer BCRYPT_ROUNDS, using %d", default)
+        return default
+    if not 4 <= rounds <= 31:
+        logger.warning("BCRYPT_ROUNDS=%d is outside 4-31, using %d", rounds, default)
+        return default
+    return rounds
+
+# bcrypt cost factor for new passwords (each extra round doubles hashing time)
+BCRYPT_ROUNDS = _bcrypt_rounds()
+
+# Profile fields for a username missing from the user store
+_UNKNOWN_USER = SimpleNamespace(subscription='free', email='', first_name='', last_name='')
+
+# Every subscription level
+_ALL = frozenset({'public', 'free', 'premium'})
+
+# Subscription levels allowed to use each feature (unlisted features are open to all)
+_FEATURE_ACCESS = {
+    # All features available to everyone except data export
+    'price_charts': _ALL,
+    'power_law': _ALL,
+    'network_metrics': _ALL,
+    'technical_indicators': _ALL,
+    'advanced_charts': _ALL,
+    # Only data export requires premium
+    'data_export': frozenset({'premium'}),
+    'api_access': frozenset({'premium'}),
+}
+
+# Features available per subscription level (read-only, shared by every caller)
+_SUBSCRIPTION_FEATURES = MappingProxyType({
+    'public': MappingProxyType({
+        'data_days': 0,  # unlimited for all
+        'charts': ('basic', 'technical', 'advanced'),
+        'export': False,
+        'api': False,
+        'support': 'community'
+    }),
+    'free': MappingProxyType({
+        'data_days': 0,  # unlimited
+        'charts': ('basic', 'technical', 'advanced'),
+        'export': False,
+        'api': False,
+        'support': 'community'
+    }),
+    'premium': MappingProxyType({
+        'data_days': 0,  # unlimited
+        'charts': ('basic', 'technical', 'advanced'),
+        'export': True,  # Only premium gets export
+        'api': True,
+        'support': 'email'
+    })
+})
+
+# Default configuration if the user store doesn't exist (deep-copied before use)
+_DEFAULT_AUTH_CONFIG = {
+    'credentials': {
+        'usernames': {
+            'admin': {
+                'email': 'admin@kaspalytics.com',
+                'first_name': 'Admin',
+                'last_name': 'User',
+                'password': 'admin123',
+                'subscription': 'premium',
+                'failed_login_attempts': 0,
+                'logged_in': False
+            },
+            'premium_user': {
+                'email': 'premium@example.com',
+                'first_name': 'Premium',
+                'last_name': 'User',
+                'password': 'premium123',
+                'subscription': 'premium',
+                'failed_login_attempts': 0,
+                'logged_in': False
+            },
+            'free_user': {
+                'email': 'free@example.com',
+                'first_name': 'Free',
+                'last_name': 'User',
+                'password': 'free123',
+                'subscription': 'free',
+                'failed_login_attempts': 0,
+                'logged_in': False
             }
-        },
-        'cookie': {
-            'name': 'kaspa_analytics_auth',
-            'key': 'kaspa_secret_key_change_in_production',
-            'expiry_days': 30
-        },
-        'preauthorized': [
-            'admin@kaspalytics.com',
-            'newuser@kaspalytics.com'
-        ]
-    }
+        }
+    },
+    'cookie': {
+        'name': 'kaspa_analytics_auth',
+        'key': 'kaspa_secret_key_change_in_production',
+        'expiry_days': 30
+    },
+    'preauthorized': [
+        'admin@kaspalytics.com',
+        'newuser@kaspalytics.com'
+    ]
+}
+
+def _user_record(info):
+    """Flatten a user store entry into the profile fields get_current_user needs"""
+    return SimpleNamespace(
+        subscription=info.get('subscription', 'free'),
+        email=info.get('email', ''),
+        first_name=info.get('first_name', ''),
+        last_name=info.get('last_name', '')
+    )
+
+def _auth_config_mtime():
+    """Modification time of the user store (0.0 when it doesn't exist yet)"""
+    try:
+        return AUTH_CONFIG_PATH.stat().st_mtime
+    except OSError:
+        return 0.0
+
+@st.cache_resource(show_spinner=False)
+def _load_auth_config():
+    """Load authentication configuration once per process (shared by all sessions)"""
+    config_path = AUTH_CONFIG_PATH
     
     # Try to load from file, fallback to default
     try:
@@ -66,15 +163,50 @@ def get_auth_config():
             with open(config_path, 'r') as file:
                 config = yaml.load(file, Loader=SafeLoader)
         else:
-            config = default_config
+            config = copy.deepcopy(_DEFAULT_AUTH_CONFIG)
     except Exception:
-        config = default_config
+        config = copy.deepcopy(_DEFAULT_AUTH_CONFIG)
     
-    # Store in session state for persistence
-    if 'auth_config' not in st.session_state:
-        st.session_state.auth_config = config
+    # Bookkeeping keys (underscore-prefixed, never written back to disk)
+    config['_mtime'] = _auth_config_mtime()
+    config['_dirty'] = False
+    config['_retry_at'] = 0.0
+    config['_failed_mtime'] = None
     
-    return st.session_state.auth_config
+    # username -> profile record, so lookups skip the nested credentials dicts
+    config['_flat_users'] = {
+        username: _user_record(info)
+        for username, info in config['credentials']['usernames'].items()
+    }
+    
+    return config
+
+def get_auth_config():
+    """Get authentication configuration"""
+    with _AUTH_CONFIG_LOCK:
+        config = _load_auth_config()
+        
+        disk_mtime = _auth_config_mtime()
+        
+        # Retry a failed write once per backoff window, or once when the file
+        # changes on disk, so a reload can't replace the unsaved changes
+        if config['_dirty']:
+            file_changed = disk_mtime not in (config['_mtime'], config['_failed_mtime'])
+            if file_changed or time.time() >= config['_retry_at']:
+                try:
+                    _write_auth_config(config)
+                except Exception as e:
+                    logger.warning("Retrying user store write failed: %s", e)
+                    config['_retry_at'] = time.time() + AUTH_CONFIG_RETRY_INTERVAL
+                    config['_failed_mtime'] = disk_mtime
+            disk_mtime = config['_mtime'] if not config['_dirty'] else disk_mtime
+        
+        # Reload if the file was edited on disk since it was loaded (never over unsaved changes)
+        if not config['_dirty'] and disk_mtime != config['_mtime']:
+            _load_auth_config.clear()
+            config = _load_auth_config()
+        
+        return config
 
 def get_authenticator():
     """Initialize and return authenticator instance"""
@@ -101,18 +233,17 @@ def get_current_user():
         username = st.session_state.get('username')
         name = st.session_state.get('name')
         
-        # Get subscription level
+        # Get subscription level and profile
         config = get_auth_config()
-        user_info = config['credentials']['usernames'].get(username, {})
-        subscription = user_info.get('subscription', 'free')
+        user_info = config['_flat_users'].get(username, _UNKNOWN_USER)
         
         return {
             'name': name,
             'username': username,
-            'subscription': subscription,
-            'email': user_info.get('email', ''),
-            'first_name': user_info.get('first_name', ''),
-            'last_name': user_info.get('last_name', '')
+            'subscription': user_info.subscription,
+            'email': user_info.email,
+            'first_name': user_info.first_name,
+            'last_name': user_info.last_name
         }
     else:
         return {
@@ -135,10 +266,10 @@ def require_authentication_for_premium():
         col1, col2 = st.columns(2)
         with col1:
             if st.button("🔑 Login", key="require_auth_login", use_container_width=True):
-                st.switch_page("pages/5_⚙️_Authentication.py")
+                st.switch_page(PAGES['auth'])
         with col2:
             if st.button("🚀 Sign Up", key="require_auth_signup", use_container_width=True, type="primary"):
-                st.switch_page("pages/5_⚙️_Authentication.py")
+                st.switch_page(PAGES['auth'])
         
         st.stop()
     
@@ -147,7 +278,7 @@ def require_authentication_for_premium():
         st.info(f"Current plan: {user['subscription'].title()}")
         
         if st.button("⬆️ Upgrade to Premium", key="require_premium_upgrade", use_container_width=True, type="primary"):
-            st.switch_page("pages/5_⚙️_Authentication.py")
+            st.switch_page(PAGES['auth'])
         
         st.stop()
     
@@ -166,36 +297,47 @@ def add_user(username, email, first_name, last_name, password, subscription='fre
     
     # Hash password
     try:
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
     except Exception as e:
         return False, f"Password hashing error: {e}"
     
-    # Add user to config
-    config['credentials']['usernames'][username] = {
-        'email': email,
-        'first_name': first_name,
-        'last_name': last_name,
-        'password': hashed_password,
-        'subscription': subscription,
-        'failed_login_attempts': 0,
-        'logged_in': False,
-        'created_at': datetime.now().isoformat()
-    }
-    
-    # Update session state
-    st.session_state.auth_config = config
+    with _AUTH_CONFIG_LOCK:
+        # Re-check under the lock, another session may have registered the name meanwhile
+        if username in config['credentials']['usernames']:
+            return False, "Username already exists"
+        
+        # Add user to config
+        config['credentials']['usernames'][username] = {
+            'email': email,
+            'first_name': first_name,
+            'last_name': last_name,
+            'password': hashed_password,
+            'subscription': subscription,
+            'failed_login_attempts': 0,
+            'logged_in': False,
+            'created_at': datetime.now().isoformat()
+        }
+        config['_flat_users'][username] = _user_record(config['credentials']['usernames'][username])
+        
+        # Registrations are rare, write them through immediately
+        config['_dirty'] = True
+        save_auth_config()
     
     return True, "User created successfully"
 
 def update_user_subscription(username, new_subscription):
     """Update user subscription level"""
-    config = get_auth_config()
-    
-    if username not in config['credentials']['usernames']:
-        return False, "User not found"
-    
-    config['credentials']['usernames'][username]['subscription'] = new_subscription
-    st.session_state.auth_config = config
+    with _AUTH_CONFIG_LOCK:
+        config = get_auth_config()
+        
+        if username not in config['credentials']['usernames']:
+            return False, "User not found"
+        
+        config['credentials']['usernames'][username]['subscription'] = new_subscription
+        config['_flat_users'][username] = _user_record(config['credentials']['usernames'][username])
+        
+        config['_dirty'] = True
+        save_auth_config()
     
     return True, f"Subscription updated to {new_subscription}"
 
@@ -210,14 +352,13 @@ def logout_user():
     ]
     
     for key in auth_keys:
-        if key in st.session_state:
-            del st.session_state[key]
+        st.session_state.pop(key, None)
     
     # Try authenticator logout
     try:
         authenticator = get_authenticator()
         authenticator.logout()
-    except:
+    except Exception:
         pass
     
     # Clear any page-specific session state
@@ -229,69 +370,42 @@ def logout_user():
     ]
     
     for key in page_keys:
-        if key in st.session_state:
-            del st.session_state[key]
+        st.session_state.pop(key, None)
 
 def get_subscription_features(subscription_level):
     """Get features available for subscription level"""
-    features = {
-        'public': {
-            'data_days': 0,  # unlimited for all
-            'charts': ['basic', 'technical', 'advanced'],
-            'export': False,
-            'api': False,
-            'support': 'community'
-        },
-        'free': {
-            'data_days': 0,  # unlimited
-            'charts': ['basic', 'technical', 'advanced'],
-            'export': False,
-            'api': False,
-            'support': 'community'
-        },
-        'premium': {
-            'data_days': 0,  # unlimited
-            'charts': ['basic', 'technical', 'advanced'],
-            'export': True,  # Only premium gets export
-            'api': True,
-            'support': 'email'
-        }
-    }
-    
-    return features.get(subscription_level, features['public'])
+    return _SUBSCRIPTION_FEATURES.get(subscription_level, _SUBSCRIPTION_FEATURES['public'])
 
 def check_feature_access(feature_name, user_subscription):
     """Check if user has access to specific feature"""
-    feature_requirements = {
-        # All features available to everyone except data export
-        'price_charts': ['public', 'free', 'premium'],
-        'power_law': ['public', 'free', 'premium'],
-        'network_metrics': ['public', 'free', 'premium'],
-        'technical_indicators': ['public', 'free', 'premium'],
-        'advanced_charts': ['public', 'free', 'premium'],
-        # Only data export requires premium
-        'data_export': ['premium'],
-        'api_access': ['premium'],
-    }
+    return user_subscription in _FEATURE_ACCESS.get(feature_name, _ALL)
+
+def _write_auth_config(config):
+    """Write the cached config to disk (caller holds _AUTH_CONFIG_LOCK; raises on failure)"""
+    AUTH_CONFIG_PATH.parent.mkdir(exist_ok=True)
+    
+    with open(AUTH_CONFIG_PATH, 'w') as file:
+        yaml.dump({key: value for key, value in config.items() if not key.startswith('_')},
+                  file, default_flow_style=False)
     
-    required_subscriptions = feature_requirements.get(feature_name, ['public', 'free', 'premium'])
-    return user_subscription in required_subscriptions
+    # Our own write shouldn't trigger a reload of the cached config
+    config['_mtime'] = _auth_config_mtime()
+    config['_dirty'] = False
+    config['_failed_mtime'] = None
 
 def save_auth_config():
     """Save authentication configuration to file"""
-    try:
-        config_path = Path("config/user_config.yaml")
-        config_path.parent.mkdir(exist_ok=True)
-        
-        config = st.session_state.get('auth_config', {})
-        
-        with open(config_path, 'w') as file:
-            yaml.dump(config, file, default_flow_style=False)
-        
-        return True
-    except Exception as e:
-        st.error(f"Error saving configuration: {e}")
-        return False
+    with _AUTH_CONFIG_LOCK:
+        config = _load_auth_config()
+        try:
+            _write_auth_config(config)
+            return True
+        except Exception as e:
+            # Left dirty; get_auth_config retries after the backoff window
+            config['_retry_at'] = time.time() + AUTH_CONFIG_RETRY_INTERVAL
+            config['_failed_mtime'] = _auth_config_mtime()
+            st.error(f"Error saving configuration: {e}")
+            return False
 
 def get_user_stats(username):
     """Get user statistics and activity"""
@@ -6,6 +6,16 @@ import streamlit as st
 from pathlib import Path
 import yaml
 
+# Page scripts targeted by navigation, st.page_link and st.switch_page
+PAGES = {
+    'home': "streamlit_app.py",
+    'charts': "pages/1_📈_Price_Charts.py",
+    'power_law': "pages/2_📊_Power_Law.py",
+    'network': "pages/3_🌐_Network_Metrics.py",
+    'export': "pages/4_📋_Data_Export.py",
+    'auth': "pages/5_⚙️_Authentication.py",
+}
+
 def get_app_config():
     """Get application configuration"""
     return {
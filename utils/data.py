@@ -12,15 +12,88 @@ import json
 from typing import Optional, Dict, Any
 import time
 
+from utils._indicators_njit import sma, ewm, ema_pair, rolling_mean_std
+
+# Try to import orjson, fallback to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Try to import Plotly, fallback gracefully
 try:
     import plotly.graph_objects as go
     import plotly.express as px
+    import plotly.io as pio
     PLOTLY_AVAILABLE = True
+    
+    # Serialize figures with orjson (native NumPy arrays, no per-element tolist())
+    if ORJSON_AVAILABLE:
+        pio.json.config.default_engine = 'orjson'
 except ImportError:
     PLOTLY_AVAILABLE = False
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+# Maximum points per trace handed to Plotly
+CHART_MAX_POINTS = 2500
+
+# Chart time range -> days of history to fetch (None means the full history)
+TIME_RANGE_DAYS = {
+    '7D': 7,
+    '30D': 30,
+    '3M': 90,
+    '6M': 180,
+    '1Y': 365,
+    '2Y': 730,
+    'All': None
+}
+
+# Full history depth used when no narrower range applies
+HISTORY_DAYS = 365 * 2
+
+# Export date range -> days of history to fetch
+EXPORT_RANGE_DAYS = {
+    "Last 7 days": 7,
+    "Last 30 days": 30,
+    "Last 3 months": 90,
+    "Last 6 months": 180,
+    "Last year": 365
+}
+
+# Price frames kept in cache: every preset day count (chart ranges, export ranges,
+# the 365-day default) plus headroom for custom export ranges
+PRICE_CACHE_MAX_ENTRIES = len(
+    {days or HISTORY_DAYS for days in TIME_RANGE_DAYS.values()} | set(EXPORT_RANGE_DAYS.values()) | {365}
+) + 8
+
+# Chart timeframe -> pandas resample rule (None keeps the native hourly rows)
+TIMEFRAME_RULES = {
+    '1H': None,
+    '4H': '4h',
+    '1D': '1D',
+    '1W': '1W'
+}
+
+# Lookback window of each price overlay (fewer rows than this gives no usable line)
+OVERLAY_WINDOWS = {
+    'SMA 20': 20,
+    'SMA 50': 50,
+    'EMA 12': 12,
+    'EMA 26': 26,
+    'Bollinger Bands': 20
+}
+
+# How each price column is aggregated when resampling
+OHLCV_AGGREGATION = {
+    'price': 'last',
+    'open': 'first',
+    'high': 'max',
+    'low': 'min',
+    'close': 'last',
+    'volume': 'sum'
+}
+
+@st.cache_data(ttl=300, max_entries=PRICE_CACHE_MAX_ENTRIES)  # Cache for 5 minutes
 def fetch_kaspa_price_data(days_back: int = 365) -> pd.DataFrame:
     """
     Fetch Kaspa price data
@@ -72,6 +145,9 @@ def fetch_kaspa_price_data(days_back: int = 365) -> pd.DataFrame:
         # Fix first open price
         df.loc[0, 'open'] = df.loc[0, 'close']
         
+        # Volume in millions for charts, computed once with the cached frame
+        df['volume_m'] = df['volume'].to_numpy() * 1e-6
+        
         return df
         
     except Exception as e:
@@ -140,6 +216,30 @@ def fetch_network_metrics() -> Dict[str, Any]:
         st.error(f"Error fetching network metrics: {e}")
         return {}
 
+def _price_frame_fingerprint(df: pd.DataFrame) -> tuple:
+    """Cheap cache key for a price frame: its size, time span and latest price"""
+    if df.empty:
+        return (0,)
+    return (len(df), df['timestamp'].iat[0], df['timestamp'].iat[-1], df['price'].iat[-1])
+
+def format_market_stats(stats: Dict[str, float]) -> Dict[str, str]:
+    """Display strings for the market stats shown as metric tiles (missing stats show as 0)"""
+    def value(key):
+        return float(stats.get(key, 0))
+    
+    return {
+        'current_price': f"${value('current_price'):.4f}",
+        'price_change_24h': f"{value('price_change_24h'):+.2f}%",
+        'price_change_7d': f"{value('price_change_7d'):+.2f}%",
+        'high_24h': f"${value('high_24h'):.4f}",
+        'low_24h': f"${value('low_24h'):.4f}",
+        'volume_24h': f"${value('volume_24h'):,.0f}",
+        'volume_24h_m': f"${value('volume_24h') / 1000000:.1f}M",
+        'market_cap': f"${value('market_cap'):.1f}B",
+        'hash_rate': f"{value('hash_rate'):.2f} EH/s"
+    }
+
+@st.cache_data(ttl=300, show_spinner=False, hash_funcs={pd.DataFrame: _price_frame_fingerprint})
 def get_market_stats(df: pd.DataFrame) -> Dict[str, float]:
     """Calculate market statistics from price data"""
     if df.empty:
@@ -171,7 +271,7 @@ def get_market_stats(df: pd.DataFrame) -> Dict[str, float]:
         # Network metrics
         network_data = fetch_network_metrics()
         
-        return {
+        stats = {
             'current_price': current_price,
             'price_change_24h': change_24h,
             'price_change_7d': change_7d,
@@ -185,6 +285,11 @@ def get_market_stats(df: pd.DataFrame) -> Dict[str, float]:
             'active_addresses': network_data.get('active_addresses', 0)
         }
         
+        # Tile strings are formatted here so reruns replay them from the cache
+        stats['formatted'] = format_market_stats(stats)
+        
+        return stats
+        
     except Exception as e:
         st.error(f"Error calculating market stats: {e}")
         return {}
@@ -275,6 +380,22 @@ def filter_data_by_subscription(df: pd.DataFrame, subscription_level: str) -> pd
     else:
         return df.tail(limit)
 
+def resample_price_data(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Aggregate hourly OHLCV rows into bars of the selected chart timeframe"""
+    rule = TIMEFRAME_RULES.get(timeframe)
+    if df.empty or rule is None:
+        return df
+    
+    aggregation = {col: how for col, how in OHLCV_AGGREGATION.items() if col in df.columns}
+    
+    return (
+        df.set_index('timestamp')
+        .resample(rule)
+        .agg(aggregation)
+        .dropna()
+        .reset_index()
+    )
+
 @st.cache_data(ttl=1800)  # Cache for 30 minutes
 def get_technical_indicators(df: pd.DataFrame) -> Dict[str, Any]:
     """Calculate technical indicators"""
@@ -282,19 +403,18 @@ def get_technical_indicators(df: pd.DataFrame) -> Dict[str, Any]:
         return {}
     
     try:
-        prices = df['price'].values
+        prices = np.ascontiguousarray(df['price'].values, dtype=np.float64)
         
         # Simple Moving Averages
         sma_20 = pd.Series(prices).rolling(window=20).mean().values
         sma_50 = pd.Series(prices).rolling(window=50).mean().values
         
-        # Exponential Moving Average
-        ema_12 = pd.Series(prices).ewm(span=12).mean().values
-        ema_26 = pd.Series(prices).ewm(span=26).mean().values
+        # Exponential Moving Averages (both spans in one pass)
+        ema_12, ema_26 = ema_pair(prices, 12, 26)
         
         # MACD
         macd_line = ema_12 - ema_26
-        macd_signal = pd.Series(macd_line).ewm(span=9).mean().values
+        macd_signal = ewm(macd_line, 9)
         macd_histogram = macd_line - macd_signal
         
         # RSI
@@ -315,17 +435,17 @@ def get_technical_indicators(df: pd.DataFrame) -> Dict[str, Any]:
         bb_lower = bb_middle - (bb_std * 2)
         
         return {
-            'sma_20': sma_20.tolist(),
-            'sma_50': sma_50.tolist(),
-            'ema_12': ema_12.tolist(),
-            'ema_26': ema_26.tolist(),
-            'macd_line': macd_line.tolist(),
-            'macd_signal': macd_signal.tolist(),
-            'macd_histogram': macd_histogram.tolist(),
-            'rsi': rsi.tolist(),
-            'bb_upper': bb_upper.tolist(),
-            'bb_middle': bb_middle.tolist(),
-            'bb_lower': bb_lower.tolist(),
+            'sma_20': np.asarray(sma_20, dtype=np.float64),
+            'sma_50': np.asarray(sma_50, dtype=np.float64),
+            'ema_12': np.asarray(ema_12, dtype=np.float64),
+            'ema_26': np.asarray(ema_26, dtype=np.float64),
+            'macd_line': np.asarray(macd_line, dtype=np.float64),
+            'macd_signal': np.asarray(macd_signal, dtype=np.float64),
+            'macd_histogram': np.asarray(macd_histogram, dtype=np.float64),
+            'rsi': np.asarray(rsi, dtype=np.float64),
+            'bb_upper': np.asarray(bb_upper, dtype=np.float64),
+            'bb_middle': np.asarray(bb_middle, dtype=np.float64),
+            'bb_lower': np.asarray(bb_lower, dtype=np.float64),
             'current_values': {
                 'rsi': rsi[-1] if len(rsi) > 0 else None,
                 'macd': macd_line[-1] if len(macd_line) > 0 else None,
@@ -337,6 +457,118 @@ def get_technical_indicators(df: pd.DataFrame) -> Dict[str, Any]:
         st.error(f"Error calculating technical indicators: {e}")
         return {}
 
+@st.cache_data(ttl=300, show_spinner=False)
+def get_overlay_indicators(prices: np.ndarray, overlays: tuple) -> Dict[str, np.ndarray]:
+    """
+    Calculate price overlay indicators (SMA, EMA, Bollinger Bands)
+    Keyed on the price array and the selected overlay set so widget reruns reuse the result
+    """
+    if prices.size == 0:
+        return {}
+
+    try:
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        result = {}
+
+        # SMA 20 and the Bollinger middle band are the same series; one pass yields both plus the std
+        if "SMA 20" in overlays or "Bollinger Bands" in overlays:
+            sma_20, std_20 = rolling_mean_std(prices, 20)
+            if "SMA 20" in overlays:
+                result['sma_20'] = sma_20
+            if "Bollinger Bands" in overlays:
+                result['bb_upper'] = sma_20 + (std_20 * 2)
+                result['bb_middle'] = sma_20
+                result['bb_lower'] = sma_20 - (std_20 * 2)
+
+        if "SMA 50" in overlays:
+            result['sma_50'] = sma(prices, 50)
+        if "EMA 12" in overlays and "EMA 26" in overlays:
+            result['ema_12'], result['ema_26'] = ema_pair(prices, 12, 26)
+        elif "EMA 12" in overlays:
+            result['ema_12'] = ewm(prices, 12)
+        elif "EMA 26" in overlays:
+            result['ema_26'] = ewm(prices, 26)
+
+        return result
+
+    except Exception as e:
+        st.error(f"Error calculating overlay indicators: {e}")
+        return {}
+
+def downsample_lttb(x, y, n_out: int = CHART_MAX_POINTS):
+    """
+    Downsample a time series with Largest-Triangle-Three-Buckets
+    Keeps the visual shape of the trace while bounding the points sent to Plotly
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = min(len(x), len(y))
+    x, y = x[:n], y[:n]
+
+    # Indicator warm-up windows leave NaNs that Plotly skips anyway
+    valid = ~np.isnan(y)
+    if not valid.all():
+        x, y = x[valid], y[valid]
+        n = len(y)
+
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    if np.issubdtype(x.dtype, np.datetime64):
+        x_num = x.astype(np.int64).astype(np.float64)
+    else:
+        x_num = x.astype(np.float64)
+
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x_num[:n - 1], edges[:-1]) / counts, x_num[-1])
+    avg_y = np.append(np.add.reduceat(y[:n - 1], edges[:-1]) / counts, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x_num[a], y[a]
+        area = np.abs(
+            (ax - avg_x[i + 1]) * (y[lo:hi] - ay) - (ax - x_num[lo:hi]) * (avg_y[i + 1] - ay)
+        )
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+
+    return x[selected], y[selected]
+
+def downsample_bars(x, y, n_out: int = CHART_MAX_POINTS, how: str = 'mean'):
+    """
+    Downsample a bar series into at most n_out equal-width buckets of consecutive rows
+    Each bar sits at its bucket's first x and carries the bucket's mean (per-row scale,
+    so a constant series stays constant) or sum; no rows are dropped the way LTTB drops them
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = min(len(x), len(y))
+    x, y = x[:n], y[:n]
+
+    valid = ~np.isnan(y)
+    if not valid.all():
+        x, y = x[valid], y[valid]
+        n = len(y)
+
+    if n <= n_out or n_out < 1:
+        return x, y
+
+    # Integer stride, so every bucket but possibly the last holds exactly `step` rows
+    step = -(-n // n_out)
+    starts = np.arange(0, n, step)
+    totals = np.add.reduceat(y, starts)
+    if how == 'mean':
+        totals /= np.diff(np.append(starts, n))
+
+    return x[starts], totals
+
 def export_data_to_csv(df: pd.DataFrame, filename: str = None) -> str:
     """Export data to CSV format"""
     if filename is None:
@@ -344,9 +576,22 @@ def export_data_to_csv(df: pd.DataFrame, filename: str = None) -> str:
     
     return df.to_csv(index=False)
 
-def export_data_to_json(df: pd.DataFrame) -> str:
-    """Export data to JSON format"""
-    return df.to_json(orient='records', date_format='iso')
+def export_data_to_json(df: pd.DataFrame) -> bytes:
+    """Export data to JSON format (records with ISO timestamps) as UTF-8 bytes"""
+    if not ORJSON_AVAILABLE:
+        return df.to_json(orient='records', date_format='iso').encode('utf-8')
+    
+    # Convert column-wise in C (ISO strings, native floats), then zip into records
+    columns = list(df.columns)
+    values = []
+    for column in columns:
+        array = df[column].to_numpy()
+        if np.issubdtype(array.dtype, np.datetime64):
+            values.append(np.datetime_as_string(array, unit='ms').tolist())
+        else:
+            values.append(array.tolist())
+    
+    return orjson.dumps([dict(zip(columns, row)) for row in zip(*values)], default=str)
 
 @st.cache_data(ttl=86400)  # Cache for 24 hours
 def get_historical_events() -> list:
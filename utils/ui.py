@@ -3,426 +3,218 @@ UI utilities and components for Kaspa Analytics Pro
 Handles styling, common components, and layout utilities
 """
 
+import html
+import warnings
 import streamlit as st
-import streamlit_antd_components as sac
-from datetime import datetime
-from utils.auth import get_current_user, logout_user, check_feature_access
+import pandas as pd
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+from utils.auth import logout_user, check_feature_access
+from utils.config import PAGES
 
+# Magnitude thresholds and suffixes for format_number, largest first
+_MAGNITUDE_UNITS = ((1e9, 'B'), (1e6, 'M'), (1e3, 'K'))
+
+# Application stylesheet, read once at import and wrapped in a style tag
+_CSS = (Path(__file__).resolve().parent.parent / "static" / "kaspa.css").read_text(encoding="utf-8")
+_STYLE_HTML = f"<style>\n{_CSS}</style>"
+
+# Sidebar navigation links: label -> (icon, page script)
+NAV_PAGES = {
+    'Dashboard': ('🏠', PAGES['home']),
+    'Price Charts': ('📈', PAGES['charts']),
+    'Power Law': ('📊', PAGES['power_law']),
+    'Network Metrics': ('🌐', PAGES['network']),
+    'Data Export': ('📋', PAGES['export']),
+}
+
+# Free vs Premium feature comparison, built once at import
+_FEATURES_DF = pd.DataFrame([
+    ("Price Charts & Analysis", "✅", "✅"),
+    ("Power Law Models", "✅", "✅"),
+    ("Network Metrics", "✅", "✅"),
+    ("Technical Indicators", "✅", "✅"),
+    ("Full Historical Data", "✅", "✅"),
+    ("Real-time Updates", "✅", "✅"),
+    ("Data Export (CSV/JSON)", "❌", "✅"),
+    ("API Access", "❌", "✅"),
+    ("Email Support", "❌", "✅"),
+    ("No Ads", "✅", "✅"),
+], columns=["Feature", "Free", "Premium"])
+
+# HTML templates and static blocks, sent through st.html (no markdown parsing)
+# Template substitutions are HTML-escaped by the callers
+_HEADER_TPL = Template("""
+<div class="page-header">
+    <h1>$title</h1>
+    $sub
+</div>
+""")
+
+_SIDEBAR_HEADER_TPL = Template("""
+<h1>💎 Kaspa Analytics</h1>
+<p><em>Professional Analysis Platform</em></p>
+<p><strong>👤 $name</strong></p>
+<span class="subscription-badge badge-$tier">$badge</span>
+""")
+
+_INFO_BOX_TPL = Template("""
+<div class="feature-highlight">
+    <h4>$icon $title</h4>
+    <p>$content</p>
+</div>
+""")
+
+_CTA_TPL = Template("""
+<div class="$variant">
+    <h3>$title</h3>
+    $body
+</div>
+""")
+
+_FOOTER_HTML = """
+<div class="footer">
+    <p><strong>💎 Kaspa Analytics Pro</strong> - Professional blockchain analysis platform</p>
+    <p>
+        <a href="https://kaspa-analytics.com/about">About</a> | 
+        <a href="https://kaspa-analytics.com/privacy">Privacy Policy</a> | 
+        <a href="https://kaspa-analytics.com/terms">Terms of Service</a> | 
+        <a href="https://kaspa-analytics.com/contact">Contact</a>
+    </p>
+    <p>© 2024 Kaspa Analytics Pro. All rights reserved.</p>
+    <p><small>Data provided for educational and analysis purposes. Not financial advice.</small></p>
+</div>
+"""
+
+@st.cache_data(show_spinner=False)
 def apply_custom_css():
-    """Apply custom CSS styling for the entire application"""
-    st.markdown("""
-    <style>
-    /* Hide default Streamlit navigation */
-    .css-1d391kg {
-        display: none;
-    }
-    
-    /* Hide default sidebar navigation */
-    section[data-testid="stSidebar"] .css-ng1t4o {
-        display: none;
-    }
-    
-    /* Hide default page navigation */
-    .css-10trblm {
-        display: none;
-    }
-    
-    /* Hide streamlit pages navigation */
-    [data-testid="stSidebarNav"] {
-        display: none;
-    }
-    
-    /* Hide the default navigation menu */
-    .css-1544g2n {
-        display: none;
-    }
-    
-    /* Main theme colors */
-    :root {
-        --kaspa-primary: #70C7BA;
-        --kaspa-secondary: #49A097;
-        --kaspa-accent: #667eea;
-        --kaspa-gradient: linear-gradient(135deg, #70C7BA 0%, #49A097 100%);
-        --kaspa-accent-gradient: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    
-    /* Page header styling */
-    .page-header {
-        background: var(--kaspa-gradient);
-        padding: 2rem;
-        border-radius: 12px;
-        color: white;
-        margin-bottom: 2rem;
-        text-align: center;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .page-header h1 {
-        margin: 0 0 0.5rem 0;
-        font-size: 2.5rem;
-        font-weight: 700;
-    }
-    
-    .page-header p {
-        margin: 0;
-        opacity: 0.9;
-        font-size: 1.1rem;
-    }
-    
-    /* Authentication container */
-    .auth-container {
-        background: white;
-        padding: 2rem;
-        border-radius: 12px;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        border: 1px solid #e9ecef;
-        margin: 1rem 0;
-    }
-    
-    /* Subscription badges */
-    .subscription-badge {
-        padding: 0.25rem 0.75rem;
-        border-radius: 12px;
-        font-size: 0.8rem;
-        font-weight: bold;
-        display: inline-block;
-        margin: 0.25rem 0;
-    }
-    
-    .badge-public {
-        background: #28a745;
-        color: white;
-    }
-    
-    .badge-free {
-        background: #6c757d;
-        color: white;
-    }
-    
-    .badge-premium {
-        background: linear-gradient(45deg, #FFD700, #FFA500);
-        color: #000;
-    }
-    
-    /* Login prompt styling */
-    .login-prompt {
-        background: var(--kaspa-accent-gradient);
-        padding: 2rem;
-        border-radius: 12px;
-        color: white;
-        text-align: center;
-        margin: 2rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .login-prompt h3 {
-        margin: 0 0 1rem 0;
-    }
-    
-    /* Feature highlight boxes */
-    .feature-highlight {
-        background: #f8f9fa;
-        padding: 1.5rem;
-        border-radius: 8px;
-        border-left: 4px solid var(--kaspa-primary);
-        margin: 1rem 0;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-    }
-    
-    /* Upgrade prompt */
-    .upgrade-prompt {
-        background: var(--kaspa-accent-gradient);
-        padding: 2rem;
-        border-radius: 12px;
-        color: white;
-        text-align: center;
-        margin: 2rem 0;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Stats cards */
-    .stats-card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-        border: 1px solid #e9ecef;
-        text-align: center;
-    }
-    
-    /* Navigation styling */
-    .nav-section {
-        margin: 1rem 0;
-        padding: 1rem;
-        background: #f8f9fa;
-        border-radius: 8px;
-    }
-    
-    /* Footer styling */
-    .footer {
-        background: #f8f9fa;
-        padding: 2rem;
-        margin-top: 3rem;
-        border-radius: 8px;
-        text-align: center;
-        color: #6c757d;
-    }
-    
-    .footer a {
-        color: var(--kaspa-primary);
-        text-decoration: none;
-    }
-    
-    .footer a:hover {
-        text-decoration: underline;
-    }
-    
-    /* Error and warning styling */
-    .stAlert > div {
-        border-radius: 8px;
-    }
-    
-    /* Custom metric styling */
-    .metric-container {
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-    
-    /* Sidebar styling */
-    .sidebar .element-container {
-        margin-bottom: 0.5rem;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        border-radius: 8px;
-        font-weight: 500;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.2);
-    }
-    
-    /* Chart container */
-    .chart-container {
-        background: white;
-        padding: 1rem;
-        border-radius: 8px;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.05);
-        margin: 1rem 0;
-    }
-    
-    /* Mobile responsiveness */
-    @media (max-width: 768px) {
-        .page-header h1 {
-            font-size: 2rem;
-        }
-        
-        .page-header {
-            padding: 1.5rem;
-        }
-        
-        .auth-container {
-            padding: 1rem;
-        }
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    
-    /* Custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: var(--kaspa-primary);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: var(--kaspa-secondary);
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    """
+    Apply custom CSS styling for the entire application
+    Sent through st.html (no markdown parsing) and replayed from cache on reruns
+    The rules live in static/kaspa.css
+    """
+    st.html(_STYLE_HTML)
+
+@st.cache_data(show_spinner=False)
+def render_seo_meta(meta_html: str):
+    """
+    Render a page's static SEO meta tags
+    Cached per HTML string, so reruns replay the element instead of rebuilding it
+    """
+    st.markdown(meta_html, unsafe_allow_html=True)
 
 def render_page_header(title: str, subtitle: str = "", show_auth_buttons: bool = False):
     """Render a consistent page header"""
-    st.markdown(f"""
-    <div class="page-header">
-        <h1>{title}</h1>
-        {f'<p>{subtitle}</p>' if subtitle else ''}
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_HEADER_TPL.substitute(
+        title=html.escape(title),
+        sub=f"<p>{html.escape(subtitle)}</p>" if subtitle else ""
+    ))
     
     if show_auth_buttons:
         col1, col2, col3 = st.columns([1, 1, 1])
         
         with col2:
-            auth_cols = st.columns(2)
-            
-            with auth_cols[0]:
-                if st.button("🔑 Login", key="header_login_btn", use_container_width=True):
-                    st.switch_page("pages/5_⚙️_Authentication.py")
-            
-            with auth_cols[1]:
-                if st.button("🚀 Sign Up", key="header_signup_btn", use_container_width=True, type="primary"):
-                    st.switch_page("pages/5_⚙️_Authentication.py")
+            render_header_auth_buttons()
+
+@st.fragment
+def render_header_auth_buttons():
+    """Header Login / Sign Up buttons (a click reruns only this fragment before switching page)"""
+    auth_cols = st.columns(2)
+    
+    with auth_cols[0]:
+        if st.button("🔑 Login", key="header_login_btn", use_container_width=True):
+            st.switch_page(PAGES['auth'])
+    
+    with auth_cols[1]:
+        if st.button("🚀 Sign Up", key="header_signup_btn", use_container_width=True, type="primary"):
+            st.switch_page(PAGES['auth'])
 
 def render_sidebar_navigation(user):
     """Render sidebar navigation for all pages"""
     with st.sidebar:
-        # Logo and title
-        st.markdown("# 💎 Kaspa Analytics")
-        st.markdown(f"*Professional Analysis Platform*")
-        
-        # User info
-        if user['username'] != 'public':
-            st.markdown(f"**👤 {user['name']}**")
-            st.markdown(f'<span class="subscription-badge badge-{user["subscription"]}">{user["subscription"].upper()}</span>', unsafe_allow_html=True)
-        else:
-            st.markdown("**👤 Public Access**")
-            st.markdown('<span class="subscription-badge badge-public">FREE ACCESS</span>', unsafe_allow_html=True)
-        
-        st.markdown("---")
-        
-        # Navigation menu
-        st.markdown("### 📊 Navigation")
-        
-        # Home - Available to all
-        if st.button("🏠 Dashboard", use_container_width=True, key="nav_home"):
-            st.switch_page("streamlit_app.py")
-        
-        # Price Charts - Available to all
-        if st.button("📈 Price Charts", use_container_width=True, key="nav_charts"):
-            st.switch_page("pages/1_📈_Price_Charts.py")
-        
-        # Power Law - Available to all
-        if st.button("📊 Power Law", use_container_width=True, key="nav_powerlaw"):
-            st.switch_page("pages/2_📊_Power_Law.py")
-        
-        # Network Metrics - Available to all
-        if st.button("🌐 Network Metrics", use_container_width=True, key="nav_network"):
-            st.switch_page("pages/3_🌐_Network_Metrics.py")
-        
-        # Data Export - Premium only
-        if check_feature_access('data_export', user['subscription']):
-            if st.button("📋 Data Export", use_container_width=True, key="nav_export"):
-                st.switch_page("pages/4_📋_Data_Export.py")
+        render_sidebar_contents(user)
+
+@st.fragment
+def render_sidebar_contents(user):
+    """Sidebar body, isolated as a fragment (page links navigate client-side, without a rerun)"""
+    # Logo, title and user info in one element
+    if user['username'] != 'public':
+        tier = user['subscription']
+        st.html(_SIDEBAR_HEADER_TPL.substitute(name=html.escape(user['name']), tier=tier, badge=tier.upper()))
+    else:
+        st.html(_SIDEBAR_HEADER_TPL.substitute(name="Public Access", tier="public", badge="FREE ACCESS"))
+    
+    # Navigation menu
+    st.html('<hr><h3>📊 Navigation</h3>')
+    
+    # Data Export - Premium only
+    can_export = check_feature_access('data_export', user['subscription'])
+    
+    for label, (icon, page) in NAV_PAGES.items():
+        if label == 'Data Export' and not can_export:
+            st.page_link(page, label=label, icon="🔒", disabled=True, help="Requires Premium Account", use_container_width=True)
         else:
-            st.button("🔒 Data Export", disabled=True, use_container_width=True, help="Requires Premium Account")
-        
-        st.markdown("---")
-        
-        # Authentication section
-        st.markdown("### ⚙️ Account")
-        
-        if user['username'] == 'public':
-            if st.button("🔑 Login", use_container_width=True, key="sidebar_login"):
-                st.switch_page("pages/5_⚙️_Authentication.py")
-            
-            if st.button("🚀 Create Account", use_container_width=True, key="sidebar_signup", type="primary"):
-                st.switch_page("pages/5_⚙️_Authentication.py")
+            st.page_link(page, label=label, icon=icon, use_container_width=True)
+    
+    # Authentication section
+    st.html('<hr><h3>⚙️ Account</h3>')
+    
+    if user['username'] == 'public':
+        st.page_link(PAGES['auth'], label="Login", icon="🔑", use_container_width=True)
+        st.page_link(PAGES['auth'], label="Create Account", icon="🚀", use_container_width=True)
+    
+    else:
+        st.page_link(PAGES['auth'], label="Profile & Settings", icon="👤", use_container_width=True)
         
-        else:
-            if st.button("👤 Profile & Settings", use_container_width=True, key="sidebar_profile"):
-                st.switch_page("pages/5_⚙️_Authentication.py")
-            
-            if st.button("🚪 Logout", use_container_width=True, key="sidebar_logout"):
-                logout_user()
-                st.rerun()
+        # Logout mutates server-side session state, so it stays a button
+        if st.button("🚪 Logout", use_container_width=True, key="sidebar_logout"):
+            logout_user()
+            st.rerun()
+
+def _render_cta(variant: str, title: str, body: str, secondary: tuple, primary: tuple):
+    """Render a call-to-action card with two links to the Authentication page ((icon, label) pairs)"""
+    st.html(_CTA_TPL.substitute(variant=variant, title=title, body=body))
+    
+    for col, (icon, label) in zip(st.columns(2), (secondary, primary)):
+        with col:
+            st.page_link(PAGES['auth'], label=label, icon=icon, use_container_width=True)
 
 def show_premium_required_prompt():
     """Show premium required prompt for data export"""
-    st.markdown(f"""
-    <div class="upgrade-prompt">
-        <h3>⭐ Premium Feature Required</h3>
-        <p>Data export is available exclusively for Premium subscribers.</p>
-        <p><strong>Upgrade to Premium - $29/month</strong></p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("🔑 Login", use_container_width=True, key="premium_login"):
-            st.switch_page("pages/5_⚙️_Authentication.py")
-    
-    with col2:
-        if st.button("⭐ Get Premium", type="primary", use_container_width=True, key="get_premium"):
-            st.switch_page("pages/5_⚙️_Authentication.py")
+    _render_cta(
+        "upgrade-prompt",
+        "⭐ Premium Feature Required",
+        "<p>Data export is available exclusively for Premium subscribers.</p>"
+        "<p><strong>Upgrade to Premium - $29/month</strong></p>",
+        ("🔑", "Login"),
+        ("⭐", "Get Premium")
+    )
 
 def show_create_account_prompt():
     """Show create account prompt for public users"""
-    st.markdown(f"""
-    <div class="login-prompt">
-        <h3>🚀 Join Kaspa Analytics</h3>
-        <p>Create your free account to track your usage and upgrade when ready!</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("🔑 Login", use_container_width=True, key="account_login"):
-            st.switch_page("pages/5_⚙️_Authentication.py")
-    
-    with col2:
-        if st.button("🚀 Create Account", type="primary", use_container_width=True, key="create_account"):
-            st.switch_page("pages/5_⚙️_Authentication.py")
+    _render_cta(
+        "login-prompt",
+        "🚀 Join Kaspa Analytics",
+        "<p>Create your free account to track your usage and upgrade when ready!</p>",
+        ("🔑", "Login"),
+        ("🚀", "Create Account")
+    )
 
 def render_subscription_comparison():
     """Render subscription comparison table"""
     st.subheader("📊 What You Get")
     
-    features = [
-        {"feature": "Price Charts & Analysis", "free": "✅", "premium": "✅"},
-        {"feature": "Power Law Models", "free": "✅", "premium": "✅"},
-        {"feature": "Network Metrics", "free": "✅", "premium": "✅"},
-        {"feature": "Technical Indicators", "free": "✅", "premium": "✅"},
-        {"feature": "Full Historical Data", "free": "✅", "premium": "✅"},
-        {"feature": "Real-time Updates", "free": "✅", "premium": "✅"},
-        {"feature": "Data Export (CSV/JSON)", "free": "❌", "premium": "✅"},
-        {"feature": "API Access", "free": "❌", "premium": "✅"},
-        {"feature": "Email Support", "free": "❌", "premium": "✅"},
-        {"feature": "No Ads", "free": "✅", "premium": "✅"},
-    ]
-    
-    # Create comparison table
-    col1, col2, col3 = st.columns([3, 1, 1])
-    
-    with col1:
-        st.markdown("**Feature**")
-        for feature in features:
-            st.write(feature["feature"])
-    
-    with col2:
-        st.markdown("**Free**")
-        for feature in features:
-            st.write(feature["free"])
-    
-    with col3:
-        st.markdown("**Premium**")
-        for feature in features:
-            st.write(feature["premium"])
+    st.dataframe(_FEATURES_DF, use_container_width=True, hide_index=True)
 
 def render_loading_spinner(message: str = "Loading..."):
-    """Render loading spinner with message"""
-    with st.spinner(message):
-        return True
+    """Deprecated: use `with st.spinner(message):` around the slow work instead"""
+    warnings.warn(
+        "render_loading_spinner() is deprecated; wrap the work in st.spinner() directly",
+        DeprecationWarning,
+        stacklevel=2
+    )
+    return st.spinner(message)
 
 def render_error_page(error_message: str, show_navigation: bool = True):
     """Render error page with navigation options"""
@@ -435,7 +227,7 @@ def render_error_page(error_message: str, show_navigation: bool = True):
         
         with col1:
             if st.button("🏠 Go Home", use_container_width=True, key="error_home"):
-                st.switch_page("streamlit_app.py")
+                st.switch_page(PAGES['home'])
         
         with col2:
             if st.button("🔄 Refresh Page", use_container_width=True, key="error_refresh"):
@@ -454,12 +246,7 @@ def render_success_message(message: str, show_confetti: bool = False):
 
 def render_info_box(title: str, content: str, icon: str = "ℹ️"):
     """Render information box"""
-    st.markdown(f"""
-    <div class="feature-highlight">
-        <h4>{icon} {title}</h4>
-        <p>{content}</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(_INFO_BOX_TPL.substitute(icon=html.escape(icon), title=html.escape(title), content=html.escape(content)))
 
 def render_stats_cards(stats: dict):
     """Render statistics as cards"""
@@ -472,34 +259,21 @@ def render_stats_cards(stats: dict):
             else:
                 st.metric(label, value)
 
+@st.cache_data(show_spinner=False)
 def render_footer():
-    """Render application footer"""
-    st.markdown("---")
-    st.markdown("""
-    <div class="footer">
-        <p><strong>💎 Kaspa Analytics Pro</strong> - Professional blockchain analysis platform</p>
-        <p>
-            <a href="https://kaspa-analytics.com/about">About</a> | 
-            <a href="https://kaspa-analytics.com/privacy">Privacy Policy</a> | 
-            <a href="https://kaspa-analytics.com/terms">Terms of Service</a> | 
-            <a href="https://kaspa-analytics.com/contact">Contact</a>
-        </p>
-        <p>© 2024 Kaspa Analytics Pro. All rights reserved.</p>
-        <p><small>Data provided for educational and analysis purposes. Not financial advice.</small></p>
-    </div>
-    """, unsafe_allow_html=True)
+    """Render application footer (static, replayed from cache on reruns)"""
+    st.divider()
+    st.html(_FOOTER_HTML)
 
+@lru_cache(maxsize=1024)
 def format_number(num: float, prefix: str = "", suffix: str = "", decimals: int = 2) -> str:
-    """Format numbers for display"""
-    if num >= 1e9:
-        return f"{prefix}{num/1e9:.{decimals}f}B{suffix}"
-    elif num >= 1e6:
-        return f"{prefix}{num/1e6:.{decimals}f}M{suffix}"
-    elif num >= 1e3:
-        return f"{prefix}{num/1e3:.{decimals}f}K{suffix}"
-    else:
-        return f"{prefix}{num:.{decimals}f}{suffix}"
+    """Format numbers for display (memoized, KPI values repeat across reruns)"""
+    for threshold, unit in _MAGNITUDE_UNITS:
+        if num >= threshold:
+            return f"{prefix}{num/threshold:.{decimals}f}{unit}{suffix}"
+    return f"{prefix}{num:.{decimals}f}{suffix}"
 
+@lru_cache(maxsize=1024)
 def format_percentage(value: float, show_sign: bool = True) -> str:
     """Format percentage values"""
     sign = "+" if value > 0 and show_sign else ""
@@ -536,5 +310,5 @@ def render_chart_controls():
 
 def render_breadcrumbs(pages: list):
     """Render breadcrumb navigation"""
-    breadcrumb_html = " > ".join([f'<a href="{page["url"]}">{page["name"]}</a>' for page in pages])
-    st.markdown(f"**Navigation:** {breadcrumb_html}", unsafe_allow_html=True)
+    breadcrumb_html = " &gt; ".join([f'<a href="{page["url"]}">{page["name"]}</a>' for page in pages])
+    st.html(f"<p><strong>Navigation:</strong> {breadcrumb_html}</p>")